@@ -1,16 +1,61 @@
 from fastapi import FastAPI, Query
+from fastapi.responses import ORJSONResponse, Response
+import msgspec
 from pydantic import BaseModel
 from typing import Dict, List, Optional
 import asyncio
+import argparse
+from contextlib import asynccontextmanager
+import os
 import uvicorn
 import logging
 
-from scraper.content_crawler import ContentCrawler, ContentType
+from scraper.base import ScraperResult
+from scraper.content_crawler import BrowserPool, ContentCrawler, ContentType, UCDriverHolder, shutdown_parse_pool
 from scraper.orchestrator import ScraperOrchestrator
 from scraper.blog_scraper import BlogScraper
-from scraper.pdf_scraper import PDFScraper
+from scraper.pdf_scraper import PDFScraper, shutdown_extract_pool
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared browsers and worker processes when the server shuts down."""
+    yield
+    await browser_pool.close()
+    await uc_driver.close()
+    await asyncio.to_thread(shutdown_parse_pool)
+    await asyncio.to_thread(shutdown_extract_pool)
+
+# orjson renders responses in C instead of the stdlib JSON encoder
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Scrapers hold no per-request state, so share them across /scrape calls.
+# ContentCrawler tracks visited URLs and is still created per request,
+# but every crawler borrows browsers from the same warm Playwright pool
+# and the same undetected-chromedriver.
+blog_scraper = BlogScraper(team_id="api")
+pdf_scraper = PDFScraper(team_id="api")
+browser_pool = BrowserPool()
+uc_driver = UCDriverHolder()
+# Opt-in crawler HTTP cache; every worker process opens the same file
+CACHE_PATH = os.getenv("OGSCAPER_CACHE_PATH")
+CACHE_EXPIRE_AFTER = float(os.getenv("OGSCAPER_CACHE_EXPIRE_AFTER", 3600))
+
+def new_crawler(max_pages: int) -> ContentCrawler:
+    """Create a per-request crawler on the shared browsers and HTTP cache settings."""
+    return ContentCrawler(
+        max_pages=max_pages,
+        cache_path=CACHE_PATH,
+        browser_pool=browser_pool,
+        uc_driver=uc_driver,
+        cache_expire_after=CACHE_EXPIRE_AFTER
+    )
+
+# Number of concurrent scrape workers consuming crawled URLs in /crawl-and-scrape
+SCRAPE_CONCURRENCY = 50
+
+def msgspec_response(payload) -> Response:
+    """Encode a payload containing msgspec structs straight to a JSON response."""
+    return Response(content=msgspec.json.encode(payload), media_type="application/json")
 
 class CrawlRequest(BaseModel):
     start_url: str
@@ -23,6 +68,7 @@ class ScrapeRequest(BaseModel):
     url: str
     base_url: Optional[str] = None
 
+# Response schemas for the OpenAPI docs; the payloads themselves are msgspec-encoded
 class ScrapeResponse(BaseModel):
     items: List[dict]
 
@@ -37,8 +83,11 @@ class CrawlAndScrapeResponse(BaseModel):
 
 @app.post("/crawl", response_model=CrawlResponse)
 async def crawl(request: CrawlRequest):
-    crawler = ContentCrawler(max_pages=request.max_pages)
-    results = await crawler.crawl(request.start_url)
+    crawler = new_crawler(request.max_pages)
+    try:
+        results = await crawler.crawl(request.start_url)
+    finally:
+        await crawler.close()
     # Convert ContentType keys to string for JSON serialization
     results_str = {ct.value if isinstance(ct, ContentType) else str(ct): urls for ct, urls in results.items()}
     return CrawlResponse(results=results_str)
@@ -46,34 +95,80 @@ async def crawl(request: CrawlRequest):
 @app.post("/scrape", response_model=ScrapeResponse)
 async def scrape(request: ScrapeRequest):
     # Try BlogScraper first, then PDFScraper
-    blog_scraper = BlogScraper(team_id="api")
-    pdf_scraper = PDFScraper(team_id="api")
     items = []
     if blog_scraper.can_handle(request.url):
         items = await blog_scraper.scrape(request.url, base_url=request.base_url)
     elif pdf_scraper.can_handle(request.url):
         items = await pdf_scraper.scrape(request.url, base_url=request.base_url)
-    return ScrapeResponse(items=[item.dict() for item in items])
+    return msgspec_response({"items": items})
 
 @app.post("/crawl-and-scrape", response_model=CrawlAndScrapeResponse)
 async def crawl_and_scrape(request: CrawlAndScrapeRequest):
-    orchestrator = ScraperOrchestrator(request.team_id)
-    # Crawl for all URLs
-    crawler = ContentCrawler(max_pages=request.max_pages)
-    crawled = await crawler.crawl(request.start_url)
-    # Collect all URLs to scrape (including the main page)
-    all_urls = [request.start_url]
-    for urls in crawled.values():
-        all_urls.extend(urls)
-    # Remove duplicates
-    all_urls = list(dict.fromkeys(all_urls))
-    # Scrape all URLs
-    result = await orchestrator.scrape_urls(all_urls)
-    return CrawlAndScrapeResponse(
-        team_id=request.team_id,
-        items=[item.dict() for item in result.items]
-    )
+    # Only the orchestrator's scrapers are used here; hand it the shared browsers rather than new ones
+    orchestrator = ScraperOrchestrator(request.team_id, browser_pool=browser_pool, uc_driver=uc_driver)
+    crawler = new_crawler(request.max_pages)
+    # Scrape URLs as the crawler discovers them instead of waiting for the full crawl
+    queue: asyncio.Queue = asyncio.Queue()
+    # Scraped items per URL, in the order the URLs were discovered
+    discovered: List[str] = []
+    scraped_by_url: Dict[str, list] = {}
+
+    async def scrape_worker():
+        while True:
+            url = await queue.get()
+            if url is None:
+                return
+            scraped_by_url[url] = await orchestrator.scrape_one(url, base_url=request.start_url)
+
+    async with orchestrator.shared_session():
+        workers = [asyncio.create_task(scrape_worker()) for _ in range(SCRAPE_CONCURRENCY)]
+        try:
+            # Always scrape the main page as well, and skip duplicate discoveries
+            seen = {request.start_url}
+            discovered.append(request.start_url)
+            queue.put_nowait(request.start_url)
+            try:
+                async for _, url in crawler.crawl_iter(request.start_url):
+                    if url not in seen:
+                        seen.add(url)
+                        discovered.append(url)
+                        queue.put_nowait(url)
+            finally:
+                await crawler.close()
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        finally:
+            # A failed crawl or a client disconnect would otherwise leave workers blocked on queue.get()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+    # Dedupe in discovery order so the same copy wins regardless of which scrape finished first
+    items = []
+    fingerprints = orchestrator.new_fingerprint_filter()
+    for url in discovered:
+        items.extend(orchestrator.dedupe_content(scraped_by_url.get(url, []), fingerprints))
+    return msgspec_response(ScraperResult(team_id=request.team_id, items=items))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Content Scraper API server')
+    parser.add_argument('--dev', action='store_true', help='Run a single auto-reloading worker for development')
+    return parser.parse_args()
 
 if __name__ == "__main__":
+    args = parse_args()
     logging.basicConfig(level=logging.INFO)
-    uvicorn.run("fastapi_server:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    if args.dev:
+        uvicorn.run("fastapi_server:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # One worker per core (2n+1), each on uvloop (where available) with the httptools parser
+        workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+        uvicorn.run(
+            "fastapi_server:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=workers,
+            loop="auto",
+            http="httptools",
+            reload=False
+        )
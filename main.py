@@ -3,6 +3,17 @@ import argparse
 from scraper.orchestrator import ScraperOrchestrator
 import logging
 from pathlib import Path
+from itertools import chain
+from typing import Iterator
+import sys
+
+if sys.platform != 'win32':
+    try:
+        import uvloop
+        # libuv-backed event loop; the crawler and scrapers are dominated by socket IO
+        uvloop.install()
+    except ImportError:
+        pass
 
 def setup_logging():
     logging.basicConfig(
@@ -10,9 +21,10 @@ def setup_logging():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-def read_urls_from_file(file_path: str) -> list[str]:
+def read_urls_from_file(file_path: str) -> Iterator[str]:
+    """Stream non-blank, stripped lines from a URL file."""
     with open(file_path, 'r') as f:
-        return [line.strip() for line in f if line.strip()]
+        yield from (url for line in f if (url := line.strip()))
 
 async def main():
     parser = argparse.ArgumentParser(description='Content Scraper')
@@ -21,6 +33,10 @@ async def main():
     parser.add_argument('--url-file', help='File containing URLs to scrape (one per line)')
     parser.add_argument('--output', required=True, help='Output JSON file path')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('--cache-path', default='ogscaper_cache.sqlite', help='SQLite file for the crawler HTTP cache')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the crawler HTTP cache')
+    parser.add_argument('--cache-expire-after', type=float,
+                        help='Serve cached pages younger than this many seconds without revalidating (default: always revalidate)')
     
     args = parser.parse_args()
     
@@ -29,19 +45,22 @@ async def main():
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    # Get URLs
-    urls = []
-    if args.urls:
-        urls.extend(args.urls)
+    # Get URLs, deduplicated in order in a single streaming pass
+    sources = [args.urls or []]
     if args.url_file:
-        urls.extend(read_urls_from_file(args.url_file))
+        sources.append(read_urls_from_file(args.url_file))
+    urls = list(dict.fromkeys(chain.from_iterable(sources)))
     
     if not urls:
         print("Error: No URLs provided. Use --urls or --url-file")
         return
     
     # Create orchestrator and run
-    orchestrator = ScraperOrchestrator(args.team_id)
+    orchestrator = ScraperOrchestrator(
+        args.team_id,
+        cache_path=None if args.no_cache else args.cache_path,
+        cache_expire_after=args.cache_expire_after
+    )
     result = await orchestrator.scrape_and_save(urls, args.output)
     
     print(f"\nScraping completed!")
@@ -1,25 +1,41 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+import msgspec
 from datetime import datetime
+import multiprocessing
+import sys
+import aiohttp
 
-class ContentItem(BaseModel):
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    # Fall back to the pure-Python parser when lxml is not installed
+    HTML_PARSER = 'html.parser'
+
+# Worker process pools are started from processes already running threads (executors, drivers),
+# where fork can copy a held lock into the child; start workers from a clean interpreter instead
+PROCESS_POOL_CONTEXT = multiprocessing.get_context('spawn' if sys.platform == 'win32' else 'forkserver')
+
+class ContentItem(msgspec.Struct, kw_only=True):
     title: str
     content: str
     content_type: str
     source_url: Optional[str] = None
     author: Optional[str] = None
     published_date: Optional[datetime] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = msgspec.field(default_factory=dict)
     user_id: str = ""
 
-class ScraperResult(BaseModel):
+class ScraperResult(msgspec.Struct, kw_only=True):
     team_id: str
     items: List[ContentItem]
 
 class BaseScraper(ABC):
-    def __init__(self, team_id: str):
+    def __init__(self, team_id: str, session: Optional[aiohttp.ClientSession] = None):
         self.team_id = team_id
+        # Optional HTTP session shared across scrapers (injected by the orchestrator)
+        self.session = session
 
     @abstractmethod
     async def scrape(self, url: str) -> List[ContentItem]:
@@ -1,17 +1,58 @@
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
-from typing import List, Set
+from html.parser import HTMLParser
+from typing import List, Optional, Set
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 import logging
+import sys
+from pybloom_live import BloomFilter
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Common blog post URL patterns
+BLOG_POST_PATTERNS = [
+    r'/blog/\d{4}/\d{2}/\d{2}/',  # Date-based URLs
+    r'/blog/\d{4}/\d{2}/',        # Month-based URLs
+    r'/blog/\d{4}/',              # Year-based URLs
+    r'/blog/[^/]+$',              # Simple blog post URLs
+    r'/posts/[^/]+$',             # Alternative blog post URLs
+    r'/article/[^/]+$',           # Article URLs
+]
+_BLOG_POST_RE = re.compile('|'.join(f'(?:{p})' for p in BLOG_POST_PATTERNS))
+
+# Query parameters that only track the referrer and never change the page
+_TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid'}
+
+class _AnchorCollector(HTMLParser):
+    """Streaming parser that records <a href> values without building a tree."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.hrefs: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            for name, value in attrs:
+                if name == 'href' and value:
+                    self.hrefs.append(value)
+                    break
 
 class BlogCrawler:
-    def __init__(self, max_pages: int = 10):
+    def __init__(self, max_pages: int = 10, max_concurrency: int = 5):
         self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
         self.logger = logging.getLogger(__name__)
-        self.visited_urls: Set[str] = set()
+        # Approximate membership keeps memory flat on very large crawls
+        self.visited_urls = BloomFilter(capacity=1_000_000, error_rate=0.001)
         self.blog_post_urls: Set[str] = set()
+        # Canonical keys of blog_post_urls, so variants of one post are only recorded once
+        self._blog_post_keys: Set[str] = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
 
     async def crawl(self, start_url: str) -> List[str]:
         """Crawl a blog to find all blog post URLs."""
@@ -20,74 +61,89 @@ class BlogCrawler:
             if not start_url.endswith('/'):
                 start_url += '/'
             
-            # Start with the main blog page
-            await self._process_page(start_url)
-            
-            # Find pagination links and process them
-            page_num = 2
-            while page_num <= self.max_pages:
-                next_page = self._get_next_page_url(start_url, page_num)
-                if not next_page:
-                    break
-                
-                if not await self._process_page(next_page):
-                    break
+            # One pooled session per crawl keeps keep-alive connections warm across pages
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            async with aiohttp.ClientSession(connector=connector) as self._session:
+                # Start with the main blog page
+                await self._process_page(self._session, start_url)
                 
-                page_num += 1
+                # Pagination URLs are deterministic, so fetch them all concurrently
+                page_urls = [self._get_next_page_url(start_url, page_num) for page_num in range(2, self.max_pages + 1)]
+                await asyncio.gather(
+                    *(self._process_page(self._session, page_url) for page_url in page_urls if page_url),
+                    return_exceptions=True
+                )
 
             return list(self.blog_post_urls)
         except Exception as e:
             self.logger.error(f"Error crawling {start_url}: {str(e)}")
             return list(self.blog_post_urls)
+        finally:
+            self._session = None
 
-    async def _process_page(self, url: str) -> bool:
+    async def _process_page(self, session: aiohttp.ClientSession, url: str) -> bool:
         """Process a single page and extract blog post URLs."""
-        if url in self.visited_urls:
+        page_key = self._canonicalize(url)
+        if page_key in self.visited_urls:
             return False
         
-        self.visited_urls.add(url)
+        self.visited_urls.add(page_key)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return False
-                    
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
+            # Bound concurrent requests to stay polite to the target site
+            async with self._semaphore, session.get(url) as response:
+                if response.status != 200:
+                    return False
+                
+                html = await response.text()
+                
+                # Find all links
+                for href in self._extract_hrefs(html):
+                    full_url = urljoin(url, href)
+                    # The canonical form is only a dedup key; the URL itself is kept as found
+                    url_key = self._canonicalize(full_url)
                     
-                    # Find all links
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        full_url = urljoin(url, href)
-                        
-                        # Skip if we've already processed this URL
-                        if full_url in self.visited_urls:
-                            continue
-                        
-                        # Check if it's a blog post URL
-                        if self._is_blog_post_url(full_url):
-                            self.blog_post_urls.add(full_url)
+                    # Skip if we've already processed this URL
+                    if url_key in self.visited_urls or url_key in self._blog_post_keys:
+                        continue
                     
-                    return True
+                    # Check if it's a blog post URL
+                    if self._is_blog_post_url(full_url):
+                        self._blog_post_keys.add(url_key)
+                        self.blog_post_urls.add(full_url)
+                
+                return True
         except Exception as e:
             self.logger.error(f"Error processing {url}: {str(e)}")
             return False
 
+    def _extract_hrefs(self, html: str) -> List[str]:
+        """Extract raw href values from all <a> tags on the page."""
+        # selectolax only needs to harvest anchors here, so skip the full BS4 tree
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html)
+            return [node.attributes.get('href') for node in tree.css('a[href]') if node.attributes.get('href')]
+        # Otherwise stream the page through a SAX-style parser; no tree is built
+        collector = _AnchorCollector()
+        collector.feed(html)
+        collector.close()
+        return collector.hrefs
+
+    def _canonicalize(self, url: str) -> str:
+        """Normalize equivalent URL variants to one interned key for set membership."""
+        parts = urlsplit(url)
+        query = sorted(
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS
+        )
+        path = parts.path.rstrip('/')
+        canonical = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
+        return sys.intern(canonical)
+
     def _is_blog_post_url(self, url: str) -> bool:
         """Check if a URL is likely a blog post URL."""
-        # Common blog post URL patterns
-        patterns = [
-            r'/blog/\d{4}/\d{2}/\d{2}/',  # Date-based URLs
-            r'/blog/\d{4}/\d{2}/',        # Month-based URLs
-            r'/blog/\d{4}/',              # Year-based URLs
-            r'/blog/[^/]+$',              # Simple blog post URLs
-            r'/posts/[^/]+$',             # Alternative blog post URLs
-            r'/article/[^/]+$',           # Article URLs
-        ]
-        
-        # Check if URL matches any pattern
-        return any(re.search(pattern, url) for pattern in patterns)
+        return bool(_BLOG_POST_RE.search(url))
 
     def _get_next_page_url(self, base_url: str, page_num: int) -> str:
         """Generate the next page URL based on common pagination patterns."""
@@ -1,44 +1,88 @@
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from newspaper import Article
 from newspaper.article import ArticleException
-from .base import BaseScraper, ContentItem
+from .base import BaseScraper, ContentItem, HTML_PARSER
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
-import html2text
+from bs4 import BeautifulSoup, NavigableString, Comment
 from datetime import datetime
 import logging
 from urllib.parse import urljoin
 import html
 
+# URL patterns recognised as blog posts
+BLOG_POST_PATTERNS = [
+    r'/blog/\d{4}/\d{2}/\d{2}/',  # Date-based URLs
+    r'/blog/\d{4}/\d{2}/',        # Month-based URLs
+    r'/blog/\d{4}/',              # Year-based URLs
+    r'/blog/[^/]+$',               # Simple blog post URLs
+    r'/posts/[^/]+$',              # Alternative blog post URLs
+    r'/article/[^/]+$',            # Article URLs
+    r'\.substack\.com/p/',       # Substack posts
+    r'medium\.com/@[^/]+/[^/]+$', # Medium posts
+    r'dev\.to/[^/]+/[^/]+$',      # Dev.to posts
+    # General blog/article patterns:
+    r'/\d{4}/\d{2}/\d{2}/[^/]+\.html$',  # YYYY/MM/DD/post-title.html
+    r'/\d{4}/\d{2}/[^/]+\.html$',        # YYYY/MM/post-title.html
+    r'/\d{4}/[^/]+\.html$',              # YYYY/post-title.html
+    r'/[^/]+\.html$',                     # any .html at root or subpath
+]
+_BLOG_POST_RE = re.compile('|'.join(f'(?:{p})' for p in BLOG_POST_PATTERNS))
+
+# Cleanup patterns used by _clean_content. Newline runs and space runs never
+# overlap, so they are collapsed together in one pass.
+_WHITESPACE_RUN_RE = re.compile(r'(\n{3,})|( {2,})')
+_LIST_ITEM_RE = re.compile(r'(\n\s*[-*]\s.*?)(\n{1,2})')
+_HEADER_RE = re.compile(r'(#{1,6}\s.*?)(\n{1,2})')
+# Leading author/published lines, then any remaining 'Published:' prefix
+_LEADING_BYLINE_RE = re.compile(r'^(?:(?:By [^|\n]+\|?\s*)?(?:Published:.*?)?\n+)?(?:Published: ?)?', re.IGNORECASE)
+
+
+# Markdown emission for _to_markdown
+_HEADING_LEVELS = {f'h{level}': level for level in range(1, 7)}
+_INLINE_WS_RE = re.compile(r'\s+')
+# Block-level tags whose content is set off as its own paragraph
+_BLOCK_TAGS = frozenset({
+    'div', 'section', 'article', 'main', 'aside', 'blockquote', 'figure', 'figcaption',
+    'ul', 'ol', 'dl', 'dt', 'dd', 'table', 'tr', 'form', 'address', 'hr',
+})
+# Fenced code blocks emitted for <pre>, which the cleanup passes leave verbatim
+_FENCE_RE = re.compile(r'(^```[^\n]*\n.*?\n```$)', re.MULTILINE | re.DOTALL)
+
+
+def _collapse_whitespace_run(match: re.Match) -> str:
+    return '\n\n' if match.group(1) else ' '
+
+def _outside_fences(content: str, transform) -> str:
+    """Apply transform to the text between fenced code blocks, leaving the blocks themselves untouched."""
+    # split() with one capturing group alternates text, fence, text, ...
+    parts = _FENCE_RE.split(content)
+    return ''.join(part if i % 2 else transform(part) for i, part in enumerate(parts))
+
+def _strip_lines(text: str) -> str:
+    return '\n'.join(line.strip() for line in text.split('\n'))
+
+def _tidy_markdown(text: str) -> str:
+    """The whitespace, list and header passes of _clean_content, for text outside fenced code."""
+    # Remove multiple newlines and extra spaces
+    text = _WHITESPACE_RUN_RE.sub(_collapse_whitespace_run, text)
+    # Fix list formatting (depends on the collapsed newlines above)
+    text = _LIST_ITEM_RE.sub(r'\1\n', text)
+    # Fix header formatting
+    return _HEADER_RE.sub(r'\1\n\n', text)
+
 class BlogScraper(BaseScraper):
-    def __init__(self, team_id: str):
-        super().__init__(team_id)
-        self.h2t = html2text.HTML2Text()
-        self.h2t.ignore_links = False
-        self.h2t.ignore_images = False
+    # Manual extraction shorter than this falls through to newspaper3k
+    MIN_CONTENT_LENGTH = 500
+
+    def __init__(self, team_id: str, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(team_id, session=session)
         self.logger = logging.getLogger(__name__)
 
     def can_handle(self, url: str) -> bool:
         """Check if the URL is a blog post."""
-        blog_post_patterns = [
-            r'/blog/\d{4}/\d{2}/\d{2}/',  # Date-based URLs
-            r'/blog/\d{4}/\d{2}/',        # Month-based URLs
-            r'/blog/\d{4}/',              # Year-based URLs
-            r'/blog/[^/]+$',               # Simple blog post URLs
-            r'/posts/[^/]+$',              # Alternative blog post URLs
-            r'/article/[^/]+$',            # Article URLs
-            r'\.substack\.com/p/',       # Substack posts
-            r'medium\.com/@[^/]+/[^/]+$', # Medium posts
-            r'dev\.to/[^/]+/[^/]+$',      # Dev.to posts
-            # General blog/article patterns:
-            r'/\d{4}/\d{2}/\d{2}/[^/]+\.html$',  # YYYY/MM/DD/post-title.html
-            r'/\d{4}/\d{2}/[^/]+\.html$',        # YYYY/MM/post-title.html
-            r'/\d{4}/[^/]+\.html$',              # YYYY/post-title.html
-            r'/[^/]+\.html$',                     # any .html at root or subpath
-        ]
-        return any(re.search(pattern, url.lower()) for pattern in blog_post_patterns)
+        return bool(_BLOG_POST_RE.search(url.lower()))
 
     async def scrape(self, url: str, base_url: str = None) -> List[ContentItem]:
         """Scrape a blog post and return its content using multiple fallback strategies, including Selenium and aggressive fallback."""
@@ -49,85 +93,59 @@ class BlogScraper(BaseScraper):
             elif not url.lower().startswith(('http://', 'https://')):
                 url = urljoin('https://', url)
             self.logger.info(f"Scraping blog post: {url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return []
-                    html_text = await response.text()
-                    soup = BeautifulSoup(html_text, 'html.parser')
-
-            # --- STRATEGY 1: newspaper3k ---
+            if self.session is not None:
+                html_text = await self._fetch_html(self.session, url)
+            else:
+                async with aiohttp.ClientSession() as session:
+                    html_text = await self._fetch_html(session, url)
+            if html_text is None:
+                return []
+            soup = BeautifulSoup(html_text, HTML_PARSER)
+
+            # Read the metadata before any extraction: manual extraction decomposes
+            # header/nav/footer in soup, which can take the title and byline with it
+            title = author = ""
+            date = None
+            try:
+                title = self._extract_title(soup) or ""
+                author = self._extract_author(soup) or ""
+                date = self._extract_date(soup)
+            except Exception as e:
+                self.logger.warning(f"Metadata extraction failed: {str(e)}")
+
+            # --- STRATEGY 1: Manual BeautifulSoup Extraction ---
+            # Reuses the tree parsed above; newspaper3k re-parses the HTML, so it only
+            # runs when this yields too little content.
+            manual_content = ""
+            try:
+                manual_content = self._extract_content_manually(soup, url)
+                if len(manual_content.strip()) >= self.MIN_CONTENT_LENGTH:
+                    return self._finalize(title, manual_content, url, author)
+            except Exception as e:
+                self.logger.warning(f"Manual BeautifulSoup extraction failed: {str(e)}")
+
+            # --- STRATEGY 2: newspaper3k ---
             try:
                 article = Article(url)
                 article.set_html(html_text)
                 article.parse()
                 if article.text.strip():
-                    title = article.title or self._extract_title(soup) or ""
-                    author = ", ".join(article.authors) if article.authors else self._extract_author(soup) or ""
-                    date = article.publish_date or self._extract_date(soup)
-                    content = article.text
-                    content_md = self.h2t.handle(content)
-                    content_md = self._clean_content(content_md)
-                    content_md = re.sub(r'\n{3,}', '\n\n', content_md.strip())
-                    content_md = re.sub(r'<[^>]+>', '', content_md)
-                    content_md = html.unescape(content_md.encode('utf-8').decode('unicode_escape'))
-                    title_clean = html.unescape(title.encode('utf-8').decode('unicode_escape'))
-                    return [ContentItem(
-                        title=self.normalize_content(title_clean),
-                        content=self.normalize_content(content_md),
-                        content_type="blog",
-                        source_url=url,
-                        author=author,
-                        user_id=""
-                    )]
+                    article_title = article.title or title
+                    article_author = ", ".join(article.authors) if article.authors else author
+                    date = article.publish_date or date
+                    return self._finalize(article_title, article.text, url, article_author)
             except Exception as e:
                 self.logger.warning(f"newspaper3k failed: {str(e)}")
 
-            # --- STRATEGY 2: Manual BeautifulSoup Extraction ---
-            try:
-                title = self._extract_title(soup) or ""
-                author = self._extract_author(soup) or ""
-                date = self._extract_date(soup)
-                content = self._extract_content_manually(soup)
-                if content.strip():
-                    content_md = self.h2t.handle(content)
-                    content_md = self._clean_content(content_md)
-                    content_md = re.sub(r'\n{3,}', '\n\n', content_md.strip())
-                    content_md = re.sub(r'<[^>]+>', '', content_md)
-                    content_md = html.unescape(content_md.encode('utf-8').decode('unicode_escape'))
-                    title_clean = html.unescape(title.encode('utf-8').decode('unicode_escape'))
-                    return [ContentItem(
-                        title=self.normalize_content(title_clean),
-                        content=self.normalize_content(content_md),
-                        content_type="blog",
-                        source_url=url,
-                        author=author,
-                        user_id=""
-                    )]
-            except Exception as e:
-                self.logger.warning(f"Manual BeautifulSoup extraction failed: {str(e)}")
+            # Short manual extraction still beats the cruder fallbacks below
+            if manual_content.strip():
+                return self._finalize(title, manual_content, url, author)
 
             # --- STRATEGY 3: Generic Fallback (all <p> tags) ---
             try:
-                title = self._extract_title(soup) or ""
-                author = self._extract_author(soup) or ""
-                date = self._extract_date(soup)
                 content = "\n\n".join([p.get_text() for p in soup.find_all('p')])
                 if content.strip():
-                    content_md = self.h2t.handle(content)
-                    content_md = self._clean_content(content_md)
-                    content_md = re.sub(r'\n{3,}', '\n\n', content_md.strip())
-                    content_md = re.sub(r'<[^>]+>', '', content_md)
-                    content_md = html.unescape(content_md.encode('utf-8').decode('unicode_escape'))
-                    title_clean = html.unescape(title.encode('utf-8').decode('unicode_escape'))
-                    return [ContentItem(
-                        title=self.normalize_content(title_clean),
-                        content=self.normalize_content(content_md),
-                        content_type="blog",
-                        source_url=url,
-                        author=author,
-                        user_id=""
-                    )]
+                    return self._finalize(title, content, url, author)
             except Exception as e:
                 self.logger.warning(f"Generic <p> tag extraction failed: {str(e)}")
 
@@ -153,50 +171,22 @@ class BlogScraper(BaseScraper):
                 time.sleep(2)
                 page_source = driver.page_source
                 driver.quit()
-                soup = BeautifulSoup(page_source, 'html.parser')
-                title = self._extract_title(soup) or ""
-                author = self._extract_author(soup) or ""
-                content = self._extract_content_manually(soup)
+                soup = BeautifulSoup(page_source, HTML_PARSER)
+                title = self._extract_title(soup) or title
+                author = self._extract_author(soup) or author
+                content = self._extract_content_manually(soup, url)
                 if not content.strip():
                     content = "\n\n".join([p.get_text() for p in soup.find_all('p')])
                 if content.strip():
-                    content_md = self.h2t.handle(content)
-                    content_md = self._clean_content(content_md)
-                    content_md = re.sub(r'\n{3,}', '\n\n', content_md.strip())
-                    content_md = re.sub(r'<[^>]+>', '', content_md)
-                    content_md = html.unescape(content_md.encode('utf-8').decode('unicode_escape'))
-                    title_clean = html.unescape(title.encode('utf-8').decode('unicode_escape'))
-                    return [ContentItem(
-                        title=self.normalize_content(title_clean),
-                        content=self.normalize_content(content_md),
-                        content_type="blog",
-                        source_url=url,
-                        author=author,
-                        user_id=""
-                    )]
+                    return self._finalize(title, content, url, author)
             except Exception as e:
                 self.logger.warning(f"Selenium fallback extraction failed: {str(e)}")
 
             # --- STRATEGY 5: Aggressive Fallback (all visible text from <body>) ---
             try:
-                title = self._extract_title(soup) or ""
-                author = self._extract_author(soup) or ""
                 content = soup.body.get_text(separator='\n', strip=True) if soup.body else ""
                 if content.strip():
-                    content_md = self.h2t.handle(content)
-                    content_md = self._clean_content(content_md)
-                    content_md = re.sub(r'\n{3,}', '\n\n', content_md.strip())
-                    content_md = re.sub(r'<[^>]+>', '', content_md)
-                    content_md = html.unescape(content_md.encode('utf-8').decode('unicode_escape'))
-                    title_clean = html.unescape(title.encode('utf-8').decode('unicode_escape'))
-                    return [ContentItem(
-                        title=self.normalize_content(title_clean),
-                        content=self.normalize_content(content_md),
-                        content_type="blog",
-                        source_url=url,
-                        author=author,
-                        user_id=""
-                    )]
+                    return self._finalize(title, content, url, author)
             except Exception as e:
                 self.logger.warning(f"Aggressive fallback extraction failed: {str(e)}")
 
@@ -207,12 +197,45 @@ class BlogScraper(BaseScraper):
             self.logger.error(f"Error scraping {url}: {str(e)}")
             return []
 
+    def _finalize(self, title: str, content: str, url: str, author: str) -> List[ContentItem]:
+        """Convert extracted content to clean markdown and wrap it in a ContentItem."""
+        content_md = self._clean_content(content)
+        return [ContentItem(
+            title=self.normalize_content(html.unescape(title)),
+            content=self.normalize_content(html.unescape(content_md)),
+            content_type="blog",
+            source_url=url,
+            author=author,
+            user_id=""
+        )]
+
+    async def _fetch_html(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Fetch a page with the given session, returning None on a non-200 response."""
+        async with session.get(url) as response:
+            if response.status != 200:
+                return None
+            return await response.text()
+
+    def _index_meta(self, soup: BeautifulSoup) -> Dict[Tuple[str, str], Optional[str]]:
+        """Index meta tag contents by (attribute, value) in one pass, cached on the soup."""
+        # Read the instance dict directly: attribute access on a soup falls back to a tag search
+        meta_index = vars(soup).get('_meta_index')
+        if meta_index is None:
+            meta_index = {}
+            for meta in soup.find_all('meta'):
+                for attr in ('property', 'name'):
+                    value = meta.get(attr)
+                    if value:
+                        meta_index.setdefault((attr, value), meta.get('content'))
+            setattr(soup, '_meta_index', meta_index)
+        return meta_index
+
     def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract title from various meta tags."""
         # Try meta tags first
-        for meta in soup.find_all('meta'):
-            if meta.get('property') == 'og:title':
-                return meta.get('content')
+        meta_index = self._index_meta(soup)
+        if ('property', 'og:title') in meta_index:
+            return meta_index[('property', 'og:title')]
         
         # Try article title
         article_title = soup.find('h1')
@@ -228,9 +251,10 @@ class BlogScraper(BaseScraper):
     def _extract_author(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract author from various meta tags and content."""
         # Try meta tags
-        for meta in soup.find_all('meta'):
-            if meta.get('name') in ['author', 'article:author']:
-                return meta.get('content')
+        meta_index = self._index_meta(soup)
+        for name in ['author', 'article:author']:
+            if ('name', name) in meta_index:
+                return meta_index[('name', name)]
         
         # Try common author selectors
         author_selectors = [
@@ -247,10 +271,11 @@ class BlogScraper(BaseScraper):
     def _extract_date(self, soup: BeautifulSoup) -> Optional[datetime]:
         """Extract published date from various meta tags and content."""
         # Try meta tags
-        for meta in soup.find_all('meta'):
-            if meta.get('property') in ['article:published_time', 'og:published_time']:
+        meta_index = self._index_meta(soup)
+        for prop in ['article:published_time', 'og:published_time']:
+            if ('property', prop) in meta_index:
                 try:
-                    return datetime.fromisoformat(meta.get('content').replace('Z', '+00:00'))
+                    return datetime.fromisoformat(meta_index[('property', prop)].replace('Z', '+00:00'))
                 except:
                     pass
         
@@ -272,8 +297,8 @@ class BlogScraper(BaseScraper):
         
         return None
 
-    def _extract_content_manually(self, soup: BeautifulSoup) -> str:
-        """Extract content manually when newspaper3k fails."""
+    def _extract_content_manually(self, soup: BeautifulSoup, base_url: str) -> str:
+        """Extract the main content as markdown with links resolved against base_url, decomposing page chrome in soup (run it after reading metadata)."""
         # Remove unwanted elements
         for element in soup.find_all(['script', 'style', 'nav', 'footer', 'header']):
             element.decompose()
@@ -287,38 +312,73 @@ class BlogScraper(BaseScraper):
         for selector in content_selectors:
             content_elem = soup.select_one(selector)
             if content_elem:
-                return content_elem.get_text()
+                return self._to_markdown(content_elem, base_url)
         
         # If no specific container found, get body text
-        return soup.body.get_text() if soup.body else ""
+        return self._to_markdown(soup.body, base_url) if soup.body else ""
+
+    def _to_markdown(self, node, base_url: str) -> str:
+        """Render an already-parsed subtree as markdown in a single walk."""
+        parts: List[str] = []
+        self._emit_markdown(node, parts, base_url)
+        return _outside_fences(''.join(parts), _strip_lines)
+
+    def _emit_markdown(self, node, parts: List[str], base_url: str):
+        """Append the markdown for each child of node to parts."""
+        for child in node.children:
+            if isinstance(child, Comment):
+                continue
+            if isinstance(child, NavigableString):
+                parts.append(_INLINE_WS_RE.sub(' ', str(child)))
+                continue
+            name = child.name
+            if name in _HEADING_LEVELS:
+                parts.append(f"\n\n{'#' * _HEADING_LEVELS[name]} {child.get_text(' ', strip=True)}\n\n")
+            elif name == 'p' or name in _BLOCK_TAGS:
+                parts.append('\n\n')
+                self._emit_markdown(child, parts, base_url)
+                parts.append('\n\n')
+            elif name == 'li':
+                parts.append('\n- ')
+                self._emit_markdown(child, parts, base_url)
+                parts.append('\n')
+            elif name == 'pre':
+                # Code keeps its whitespace; the language comes from a highlighter class if there is one
+                code = child.find('code')
+                classes = (code or child).get('class') or []
+                language = next((c[len('language-'):] for c in classes if c.startswith('language-')), '')
+                parts.append(f"\n\n```{language}\n{child.get_text().strip(chr(10))}\n```\n\n")
+            elif name == 'code':
+                parts.append(f'`{child.get_text()}`')
+            elif name == 'a':
+                text = child.get_text(' ', strip=True)
+                href = child.get('href')
+                parts.append(f'[{text}]({urljoin(base_url, href)})' if text and href else text)
+            elif name == 'br':
+                parts.append('\n')
+            elif name not in ('script', 'style', 'noscript'):
+                self._emit_markdown(child, parts, base_url)
 
     def _clean_content(self, content: str) -> str:
         """Clean up the extracted content."""
-        # Remove multiple newlines
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        # Remove extra spaces
-        content = re.sub(r' +', ' ', content)
-        # Fix list formatting
-        content = re.sub(r'(\n\s*[-*]\s.*?)(\n{1,2})', r'\1\n', content)
-        # Fix header formatting
-        content = re.sub(r'(#{1,6}\s.*?)(\n{1,2})', r'\1\n\n', content)
+        content = _outside_fences(content, _tidy_markdown)
         # Remove author and published lines at the start (in any order)
-        content = re.sub(r'^(By [^|\n]+\|?\s*)?(Published:.*?)?\n+', '', content, flags=re.IGNORECASE)
-        # Remove any remaining 'Published:' at the start of the content
-        content = re.sub(r'^Published: ?', '', content, flags=re.IGNORECASE)
+        content = _LEADING_BYLINE_RE.sub('', content, count=1)
         return content.strip()
 
     def normalize_content(self, content: str) -> str:
         """Normalize blog content to clean markdown."""
         content = super().normalize_content(content)
         
-        # Remove multiple newlines
-        content = re.sub(r'\n{3,}', '\n\n', content)
-        
-        # Ensure proper spacing around headers
-        content = re.sub(r'(#{1,6}\s.*?)(\n{1,2})', r'\1\n\n', content)
-        
-        # Fix list formatting
-        content = re.sub(r'(\n\s*[-*]\s.*?)(\n{1,2})', r'\1\n', content)
+        def normalize(text: str) -> str:
+            # Remove multiple newlines
+            text = re.sub(r'\n{3,}', '\n\n', text)
+            
+            # Ensure proper spacing around headers
+            text = re.sub(r'(#{1,6}\s.*?)(\n{1,2})', r'\1\n\n', text)
+            
+            # Fix list formatting
+            return re.sub(r'(\n\s*[-*]\s.*?)(\n{1,2})', r'\1\n', text)
         
-        return content.strip() 
\ No newline at end of file
+        # Fenced code keeps its blank lines and '#' comments
+        return _outside_fences(content, normalize).strip() 
\ No newline at end of file
@@ -1,11 +1,12 @@
 import aiohttp
 import asyncio
-from bs4 import BeautifulSoup
-from typing import List, Set, Dict, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import AsyncIterator, Callable, Iterator, List, Pattern, Set, Dict, Optional, Tuple
 import re
 from urllib.parse import urljoin, urlparse, urlunparse
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
 from enum import Enum
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -13,11 +14,11 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 import json
 from newspaper import Article
-import requests
 from playwright.async_api import async_playwright
 import cloudscraper
 from fake_useragent import UserAgent
@@ -29,6 +30,151 @@ import feedparser
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse, urljoin
 import os
+import io
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pybloom_live import ScalableBloomFilter
+from .base import HTML_PARSER, PROCESS_POOL_CONTEXT
+from .http_cache import HTTPCache
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:
+    lxml_etree = None
+    lxml_html = None
+
+# Feed discovery only ever looks at these tags, so don't build the rest of the tree
+_FEED_DISCOVERY_STRAINER = SoupStrainer(['a', 'link', 'meta'])
+# Feed <link type="..."> and <a href="..."> matchers for feed discovery
+_FEED_TYPE_RE = re.compile(r'rss|atom', re.I)
+_FEED_HREF_RE = re.compile(r'feed|rss|atom', re.I)
+# Turns a Quill post title into its URL slug in a single pass
+_SLUG_TRANS = str.maketrans({' ': '-', '?': None, '.': None, ',': None, "'": None})
+
+# Pages larger than this are parsed in a worker process instead of on the event loop
+_PROCESS_PARSE_THRESHOLD = 100_000
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared HTML parsing process pool, starting it on first use."""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=PROCESS_POOL_CONTEXT)
+    return _parse_pool
+
+def shutdown_parse_pool():
+    """Stop the shared HTML parsing process pool, if started; the next large page starts a new one."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
+def _parse_html(html, selectors: Tuple[str, ...]) -> List[str]:
+    """Return the href of every element matched by the given CSS selectors."""
+    # One selector list walks the tree once instead of once per selector
+    selector = ', '.join(selectors)
+    if LexborHTMLParser is not None:
+        # selectolax parses and matches in C, no per-node Python objects for the whole page
+        hrefs = (node.attributes.get('href') for node in LexborHTMLParser(html).css(selector))
+    else:
+        hrefs = (element.get('href') for element in BeautifulSoup(html, HTML_PARSER).select(selector))
+    return [href for href in hrefs if href]
+
+def _absolute_url(base_url: str, href: str) -> str:
+    """Resolve href against base_url, skipping urljoin when href is already absolute."""
+    # Most links on a page are absolute, and urljoin re-parses base_url on every call
+    if href.startswith(('http://', 'https://')):
+        return href
+    return urljoin(base_url, href)
+
+def _iter_sitemap_locs(body: bytes) -> Iterator[str]:
+    """Yield every <loc> URL of a sitemap, streaming the document instead of building a tree."""
+    if lxml_etree is not None:
+        # lxml filters on the tag in C, so only <loc> elements ever reach Python
+        events = lxml_etree.iterparse(io.BytesIO(body), events=('end',), tag='{*}loc')
+    else:
+        events = (
+            (event, elem) for event, elem in ET.iterparse(io.BytesIO(body), events=('end',))
+            if elem.tag.rpartition('}')[2] == 'loc'
+        )
+    for _, elem in events:
+        if elem.text:
+            yield elem.text.strip()
+        elem.clear()
+
+# Resolves true as soon as the page grows after a scroll, or false once the timeout passes
+_WAIT_FOR_GROWTH_JS = """
+window.__waitForGrowth = (timeout) => new Promise(resolve => {
+    const height = document.body.scrollHeight;
+    const observer = new MutationObserver(() => {
+        if (document.body.scrollHeight > height) {
+            observer.disconnect();
+            resolve(true);
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    setTimeout(() => { observer.disconnect(); resolve(false); }, timeout);
+});
+"""
+
+# The crawlers only need the DOM and its XHRs, never the page's assets
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+# Chrome profile prefs that stop Selenium / undetected-chromedriver from loading images
+_NO_IMAGES_CHROME_PREFS = {'profile.managed_default_content_settings.images': 2}
+
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts asset requests and lets everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# Collect the raw href of every element matched by the given selectors in one round trip
+_COLLECT_HREFS_JS = """
+(selectors) => {
+    const out = new Set();
+    for (const selector of selectors) {
+        document.querySelectorAll(selector).forEach(el => {
+            const href = el.getAttribute('href');
+            if (href) out.add(href);
+        });
+    }
+    return [...out];
+}
+"""
+
+# Selenium counterpart of _COLLECT_HREFS_JS, returning resolved hrefs the way WebElement.get_attribute does
+_SELENIUM_COLLECT_HREFS_JS = """
+const out = new Set();
+for (const selector of arguments[0]) {
+    document.querySelectorAll(selector).forEach(el => {
+        const href = typeof el.href === 'string' ? el.href : el.getAttribute('href');
+        if (href) out.add(href);
+    });
+}
+return [...out];
+"""
+
+# For each card, the absolute URL it links to via an anchor or data attribute, or null
+_CARD_LINKS_JS = """
+(cardSelector) => [...document.querySelectorAll(cardSelector)].map(card => {
+    const anchor = card.querySelector('a[href]');
+    if (anchor) return anchor.href;
+    const target = card.querySelector('[data-href], [data-url]') || card;
+    const link = target.getAttribute('data-href') || target.getAttribute('data-url');
+    return link ? new URL(link, document.baseURI).href : null;
+})
+"""
 
 class ContentType(Enum):
     BLOG = "blog"
@@ -57,12 +203,218 @@ class SiteConfig:
     click_selectors: List[str] = None
     custom_headers: Dict[str, str] = None
     feed_urls: List[str] = None
+    # Cancel the rest of a tier's racing strategies once this many URLs are found
+    min_urls_threshold: int = 10
+    # Content type recorded for URLs that match this site's content_patterns
+    content_type: ContentType = ContentType.BLOG
+    _compiled_patterns: List[Pattern] = field(init=False, repr=False, default_factory=list)
+
+    def __post_init__(self):
+        # Compile content_patterns once rather than on every URL check
+        self._compiled_patterns = [re.compile(p) for p in self.content_patterns]
+
+class BrowserPool:
+    """Pool of pre-launched Playwright Chromium browsers, recycled after a number of uses.
+
+    The queue always holds one entry per slot: a browser, or None for a slot whose browser
+    could not be relaunched and is launched again by the next acquire().
+    """
+
+    def __init__(self, size: int = 4, recycle_after: int = 50):
+        self.size = size
+        self.recycle_after = recycle_after
+        self.logger = logging.getLogger(__name__)
+        self._playwright = None
+        self._browsers: Optional[asyncio.Queue] = None
+        self._use_counts: Dict[int, int] = {}
+        self._start_lock = asyncio.Lock()
+
+    async def start(self):
+        """Start Playwright and launch the pool's browsers if not already running."""
+        async with self._start_lock:
+            if self._browsers is not None:
+                return
+            self._playwright = await async_playwright().start()
+            try:
+                browsers = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+            except Exception:
+                await self._playwright.stop()
+                self._playwright = None
+                self._use_counts.clear()
+                raise
+            self._browsers = asyncio.Queue()
+            for browser in browsers:
+                self._browsers.put_nowait(browser)
+
+    async def _launch(self):
+        """Launch a headless Chromium and start its use count."""
+        browser = await self._playwright.chromium.launch(headless=True)
+        self._use_counts[id(browser)] = 0
+        return browser
+
+    async def acquire(self):
+        """Check out a browser, waiting for one to be released if all are busy."""
+        await self.start()
+        queue = self._browsers
+        browser = await queue.get()
+        if queue is not self._browsers:
+            # close() woke this waiter; pass the wake-up on to the next one
+            queue.put_nowait(None)
+            raise RuntimeError("Browser pool is closed")
+        if browser is None:
+            try:
+                browser = await self._launch()
+            except Exception:
+                # Keep the slot, so the next waiter retries instead of waiting forever
+                queue.put_nowait(None)
+                raise
+        return browser
+
+    async def release(self, browser):
+        """Return a browser to the pool, relaunching it once it has been used recycle_after times."""
+        if id(browser) not in self._use_counts:
+            # Checked out before close(), so the pool no longer owns it
+            try:
+                await browser.close()
+            except Exception:
+                pass
+            return
+        self._use_counts[id(browser)] += 1
+        if self._use_counts[id(browser)] >= self.recycle_after or not browser.is_connected():
+            del self._use_counts[id(browser)]
+            try:
+                await browser.close()
+            except Exception:
+                pass
+            try:
+                browser = await self._launch()
+            except Exception as e:
+                self.logger.error(f"Failed to relaunch pooled browser: {str(e)}")
+                # Leave the slot empty; the next acquire() launches a browser for it
+                browser = None
+            if self._browsers is None:
+                # close() ran while this browser was being recycled
+                if browser is not None:
+                    try:
+                        await browser.close()
+                    except Exception:
+                        pass
+                return
+        self._browsers.put_nowait(browser)
+
+    @asynccontextmanager
+    async def new_context(self, **context_options):
+        """Yield a fresh browser context on a pooled browser, closing it and releasing the browser afterwards."""
+        browser = await self.acquire()
+        try:
+            context = await browser.new_context(**context_options)
+            try:
+                yield context
+            finally:
+                await context.close()
+        finally:
+            await self.release(browser)
+
+    async def close(self):
+        """Close idle browsers and stop Playwright; browsers still checked out are closed on release."""
+        if self._browsers is None:
+            return
+        # Detach first, so releases and acquires racing the awaits below see a closed pool
+        queue, self._browsers = self._browsers, None
+        self._use_counts.clear()
+        while not queue.empty():
+            browser = queue.get_nowait()
+            if browser is None:
+                continue
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        # Wake anyone waiting in acquire()
+        queue.put_nowait(None)
+        await self._playwright.stop()
+        self._playwright = None
+
+class UCDriverHolder:
+    """One undetected-chromedriver shared across crawlers, reset between crawls and relaunched after a number of uses."""
+
+    def __init__(self, recycle_after: int = 50):
+        self.recycle_after = recycle_after
+        self.logger = logging.getLogger(__name__)
+        self._driver = None
+        self._uses = 0
+        # The driver is driven by one worker thread at a time; hold this around acquire/release
+        self.lock = threading.Lock()
+
+    def acquire(self, user_agent: str, custom_headers: Optional[Dict[str, str]] = None):
+        """Return the shared driver, launching it on first use or once it is due for recycling."""
+        if self._driver is not None and self._uses >= self.recycle_after:
+            self.quit()
+        if self._driver is None:
+            options = uc.ChromeOptions()
+            options.add_argument('--headless')
+            options.add_argument(f'user-agent={user_agent}')
+            options.add_experimental_option('prefs', _NO_IMAGES_CHROME_PREFS)
+            
+            if custom_headers:
+                for key, value in custom_headers.items():
+                    options.add_argument(f'--header={key}: {value}')
+            
+            self._driver = uc.Chrome(options=options)
+            self._uses = 0
+        self._uses += 1
+        return self._driver
+
+    def release(self, driver):
+        """Clear cookies and web storage so the next crawl on the reused driver starts clean."""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        except Exception as e:
+            # A driver that can't be reset is not safe to reuse
+            self.logger.debug(f"Resetting undetected Chrome failed, discarding it: {str(e)}")
+            self.quit()
+
+    def quit(self):
+        """Quit the driver, if one is running."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+            self._uses = 0
+
+    async def close(self):
+        """Quit the driver from a worker thread once no crawl is using it."""
+        def quit_locked():
+            with self.lock:
+                self.quit()
+        await asyncio.to_thread(quit_locked)
 
 class ContentCrawler:
-    def __init__(self, max_pages: int = 10):
+    # User-Agents sampled from fake_useragent as needed, shared by every crawler in the process and
+    # rotated round-robin once UA_POOL_SIZE of them exist
+    UA_POOL_SIZE = 64
+    _ua_pool: List[str] = []
+    _ua_source: Optional[UserAgent] = None
+    _ua_pool_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_pages: int = 10,
+        cache_path: Optional[str] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        uc_driver: Optional[UCDriverHolder] = None,
+        cache_expire_after: Optional[float] = 3600
+    ):
         self.max_pages = max_pages
         self.logger = logging.getLogger(__name__)
-        self.visited_urls: Set[str] = set()
+        # Approximate membership keeps memory flat on very large crawls; at this error rate
+        # roughly one new URL in a thousand is mistaken for a seen one and skipped
+        self.visited_urls = ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+        # Blocking strategies validate URLs from worker threads
+        self._visited_lock = threading.Lock()
         self.content_urls: Dict[ContentType, Set[str]] = {ct: set() for ct in ContentType}
         
         # Site-specific configurations
@@ -115,6 +467,7 @@ class ContentCrawler:
                 ],
                 pagination_selectors=['.pagination a', '.next-page'],
                 content_patterns=[r'/p/[^/]+$'],
+                content_type=ContentType.SUBSTACK,
                 requires_js=True,
                 infinite_scroll=True,
                 use_undetected=True,
@@ -177,53 +530,111 @@ class ContentCrawler:
                 }
             )
         }
+        # Every site's compiled content patterns in one flat list, so classifying a URL is a single scan
+        self._flat_type_patterns: List[Tuple[ContentType, Pattern]] = [
+            (config.content_type, pattern)
+            for config in self.site_configs.values()
+            for pattern in config._compiled_patterns
+        ]
         
         # Initialize tools
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Per-crawl memo of in-flight and finished GETs, keyed by URL and headers
+        self._fetch_cache: Dict[Tuple[str, frozenset], asyncio.Future] = {}
+        # Opt-in on-disk body cache with ETag / Last-Modified revalidation for feed and HTML fetches
+        # (off by default: a shared file can serve listing pages up to cache_expire_after seconds old)
+        self.http_cache = HTTPCache(cache_path, expire_after=cache_expire_after) if cache_path else None
         self.driver = None
         self.playwright = None
+        # Blocking Selenium / cloudscraper strategies run here; each driver is used by one thread at a time
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._driver_lock = threading.Lock()
+        # A shared pool outlives this crawler; otherwise the crawler owns (and closes) its own
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool()
+        # Likewise for undetected-chromedriver: a shared holder keeps one driver warm across crawlers
+        self._owns_uc_driver = uc_driver is None
+        self.uc_driver = uc_driver or UCDriverHolder()
         self.scraper = cloudscraper.create_scraper()
-        self.ua = UserAgent()
+        # This crawler's position in the shared User-Agent rotation
+        self._ua_index = 0
+
+    def _next_ua(self) -> str:
+        """Return the next User-Agent from the shared rotation, sampling a new one while it is still filling."""
+        cls = type(self)
+        # Blocking strategies on worker threads take User-Agents too
+        with cls._ua_pool_lock:
+            pool = cls._ua_pool
+            if self._ua_index >= len(pool) and len(pool) < cls.UA_POOL_SIZE:
+                # UserAgent() loads its dataset and .random is a comparatively slow lookup,
+                # so a crawl only pays for the User-Agents the process hasn't sampled yet
+                if cls._ua_source is None:
+                    cls._ua_source = UserAgent()
+                pool.append(cls._ua_source.random)
+            ua = pool[self._ua_index % len(pool)]
+            self._ua_index += 1
+        return ua
 
     async def crawl(self, start_url: str) -> Dict[ContentType, List[str]]:
         """Crawl a website to find all content URLs using multiple strategies, with a fallback to all-links extraction."""
+        async for _ in self.crawl_iter(start_url):
+            pass
+        return {ct: list(urls) for ct, urls in self.content_urls.items() if urls}
+
+    async def crawl_iter(self, start_url: str) -> AsyncIterator[Tuple[ContentType, str]]:
+        """Crawl like crawl(), but yield (content_type, url) pairs as soon as each strategy finds them."""
         try:
             domain = urlparse(start_url).netloc
             site_config = self._get_site_config(domain)
             self.logger.info(f"Crawling {domain} with {len(site_config.content_selectors)} selectors")
-            # Try multiple crawling strategies in order of preference
-            strategies = []
+            # Strategies are grouped into tiers by cost; the strategies within a tier race each
+            # other and the next tier only starts if the previous one found nothing
             if 'quill.co' in domain:
-                strategies = [self._crawl_with_quill_api, self._crawl_with_playwright, self._crawl_with_quill_bs]
+                # Cheapest first, so Chromium is only started when the static paths find nothing.
+                # quill_bs guesses slugs from headings and nearly always returns something, so it
+                # stays a last resort behind Playwright rather than ending the crawl early
+                tiers = [
+                    [self._crawl_with_feed, self._crawl_with_quill_api],
+                    [self._crawl_with_playwright],
+                    [self._crawl_with_quill_bs]
+                ]
             else:
-                strategies = [
-                    self._crawl_with_feed,
-                    self._crawl_with_playwright if site_config.use_playwright else None,
-                    self._crawl_with_undetected if site_config.use_undetected else None,
-                    self._crawl_with_selenium,
-                    self._crawl_with_cloudscraper if site_config.use_cloudscraper else None,
-                    self._crawl_with_api,
-                    self._crawl_with_requests,
-                    self._crawl_with_aggressive_selenium  # Aggressive fallback
+                tiers = [
+                    [
+                        self._crawl_with_feed,
+                        self._crawl_with_cloudscraper if site_config.use_cloudscraper else None,
+                        self._crawl_with_api,
+                        self._crawl_with_requests
+                    ],
+                    [
+                        self._crawl_with_playwright if site_config.use_playwright else None,
+                        self._crawl_with_undetected if site_config.use_undetected else None,
+                        self._crawl_with_selenium
+                    ],
+                    [self._crawl_with_aggressive_playwright]  # Aggressive fallback
                 ]
-                strategies = [s for s in strategies if s is not None]
-            found_urls = set()
-            for strategy in strategies:
-                try:
-                    urls = await strategy(start_url, site_config)
-                    if urls:
-                        found_urls.update(urls)
-                        content_type = self._determine_content_type(start_url)
-                        self.content_urls[content_type].update(urls)
-                        break
-                except Exception as e:
-                    self.logger.warning(f"Strategy {strategy.__name__} failed: {str(e)}")
-                    continue
+            content_type = self._determine_content_type(start_url)
+            # content_urls is the one canonical set; only count what this crawl adds to it
+            known = self.content_urls[content_type]
+            found_count = 0
+            enough = lambda: found_count >= site_config.min_urls_threshold
+            for tier in tiers:
+                async for urls in self._race_strategies(tier, start_url, site_config, enough):
+                    new_urls = urls - known
+                    known.update(new_urls)
+                    found_count += len(new_urls)
+                    for found_url in new_urls:
+                        yield content_type, found_url
+                # A tier that found anything ends the crawl; only empty-handed tiers escalate
+                if found_count:
+                    break
             # Fallback: extract all links if nothing found
-            if not found_urls:
+            if not found_count:
+                all_links = set()
                 try:
-                    resp = requests.get(start_url, headers={'User-Agent': self.ua.random}, timeout=10)
-                    if resp.status_code == 200:
-                        all_links = self._extract_all_links(resp.text, start_url)
+                    status, body = await self._fetch(start_url, conditional=True)
+                    if status == 200:
+                        all_links = self._extract_all_links(body, start_url)
                         # Optionally filter links by domain
                         all_links = {l for l in all_links if urlparse(l).netloc == domain}
                         if all_links:
@@ -232,13 +643,40 @@ class ContentCrawler:
                             self.content_urls[content_type].update(all_links)
                 except Exception as e:
                     self.logger.error(f"Fallback all-links extraction failed: {str(e)}")
-            return {ct: list(urls) for ct, urls in self.content_urls.items() if urls}
+                for link in all_links:
+                    yield content_type, link
         except Exception as e:
             self.logger.error(f"Error crawling {start_url}: {str(e)}")
-            return {ct: list(urls) for ct, urls in self.content_urls.items() if urls}
         finally:
             await self._cleanup()
 
+    async def _race_strategies(self, strategies, url: str, site_config: SiteConfig, enough: Callable[[], bool]) -> AsyncIterator[Set[str]]:
+        """Run strategies concurrently, yielding each non-empty result as it lands.
+
+        Once enough() reports that the caller has what it needs, the remaining
+        strategies are cancelled.
+        """
+        tasks = {
+            asyncio.create_task(strategy(url, site_config)): strategy.__name__
+            for strategy in strategies if strategy is not None
+        }
+        pending = set(tasks)
+        try:
+            while pending and not enough():
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        urls = task.result()
+                    except Exception as e:
+                        self.logger.warning(f"Strategy {tasks[task]} failed: {str(e)}")
+                        continue
+                    if urls:
+                        yield urls
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     async def _crawl_with_feed(self, url: str, site_config: SiteConfig) -> Set[str]:
         """Crawl using RSS/XML feeds."""
         urls = set()
@@ -253,60 +691,95 @@ class ContentCrawler:
                 base_url = f"https://{domain}"
                 feed_urls.extend([urljoin(base_url, feed_path) for feed_path in site_config.feed_urls])
             
-            # Try each feed URL
-            for feed_url in feed_urls:
-                try:
-                    self.logger.debug(f"Trying feed URL: {feed_url}")
-                    
-                    # Try parsing as RSS/Atom feed
-                    feed = feedparser.parse(feed_url)
-                    if feed.entries:
-                        for entry in feed.entries:
-                            if 'link' in entry:
-                                urls.add(entry.link)
-                            elif 'id' in entry:
-                                urls.add(entry.id)
-                    
-                    # Try parsing as XML
-                    response = requests.get(feed_url, headers={'User-Agent': self.ua.random})
-                    if response.status_code == 200:
-                        try:
-                            root = ET.fromstring(response.content)
-                            # Look for common feed item elements
-                            for item in root.findall('.//{*}item') + root.findall('.//{*}entry'):
-                                link = item.find('.//{*}link')
-                                if link is not None and link.text:
-                                    urls.add(link.text)
-                                elif link is not None and 'href' in link.attrib:
-                                    urls.add(link.attrib['href'])
-                        except ET.ParseError:
-                            continue
-                    
+            # Discovery often finds the same paths the site config lists
+            feed_urls = list(dict.fromkeys(feed_urls))
+
+            # Probe every candidate feed concurrently; the first one with entries wins
+            sem = asyncio.BoundedSemaphore(8)
+            tasks = [asyncio.create_task(self._try_feed(feed_url, sem)) for feed_url in feed_urls]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    urls = await next_done
                     if urls:
-                        self.logger.info(f"Found {len(urls)} URLs in feed: {feed_url}")
                         break
-                        
-                except Exception as e:
-                    self.logger.debug(f"Failed to parse feed {feed_url}: {str(e)}")
-                    continue
-                    
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
         except Exception as e:
             self.logger.error(f"Feed crawl error: {str(e)}")
         
         return urls
 
+    async def _try_feed(self, feed_url: str, sem: asyncio.BoundedSemaphore) -> Set[str]:
+        """Fetch a single candidate feed and return the entry URLs it lists."""
+        try:
+            async with sem:
+                self.logger.debug(f"Trying feed URL: {feed_url}")
+                # A cached copy is revalidated with a conditional GET; otherwise probe before downloading
+                cached = self.http_cache and await asyncio.to_thread(self.http_cache.get, feed_url)
+                if not cached and not await self._is_feed(feed_url):
+                    return set()
+                status, body = await self._fetch(feed_url, conditional=True)
+            if status != 200:
+                return set()
+            # Parsing is CPU-bound, keep it off the event loop
+            urls = await asyncio.to_thread(self._parse_feed, body)
+        except Exception as e:
+            self.logger.debug(f"Failed to parse feed {feed_url}: {str(e)}")
+            return set()
+        if urls:
+            self.logger.info(f"Found {len(urls)} URLs in feed: {feed_url}")
+        return urls
+
+    async def _is_feed(self, url: str) -> bool:
+        """Check with a HEAD request whether a URL looks like a feed, without downloading the body."""
+        session = await self._get_session()
+        async with session.head(url, allow_redirects=True) as resp:
+            if resp.status in (405, 501):
+                # Server doesn't do HEAD, let the GET decide
+                return True
+            content_type = resp.headers.get('Content-Type', '').lower()
+            return resp.status == 200 and (not content_type or any(t in content_type for t in ('xml', 'rss', 'atom')))
+
+    def _parse_feed(self, body: bytes) -> Set[str]:
+        """Extract entry URLs from a feed body, as RSS/Atom or else as plain XML."""
+        # Try parsing as RSS/Atom feed
+        feed = feedparser.parse(body)
+        if feed.entries:
+            return {entry.link if 'link' in entry else entry.id for entry in feed.entries if 'link' in entry or 'id' in entry}
+
+        # Fall back to parsing as XML
+        urls = set()
+        try:
+            # Stream the document and drop each item once read, so large archives don't build a full tree
+            for _, elem in ET.iterparse(io.BytesIO(body), events=('end',)):
+                # Look for common feed item elements
+                if elem.tag.rpartition('}')[2] not in ('item', 'entry'):
+                    continue
+                link = elem.find('.//{*}link')
+                if link is not None and link.text:
+                    urls.add(link.text)
+                elif link is not None and 'href' in link.attrib:
+                    urls.add(link.attrib['href'])
+                elem.clear()
+        except ET.ParseError:
+            pass
+        return urls
+
     async def _discover_feed_urls(self, url: str) -> List[str]:
         """Discover feed URLs from HTML page."""
         feed_urls = []
         
         try:
-            response = requests.get(url, headers={'User-Agent': self.ua.random})
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
+            status, body = await self._fetch(url, conditional=True)
+            if status == 200:
+                soup = BeautifulSoup(body, HTML_PARSER, parse_only=_FEED_DISCOVERY_STRAINER)
+
                 # Look for feed links in HTML
-                feed_links = soup.find_all('link', type=lambda t: t and ('rss' in t.lower() or 'atom' in t.lower()))
-                feed_links.extend(soup.find_all('a', href=lambda h: h and ('feed' in h.lower() or 'rss' in h.lower() or 'atom' in h.lower())))
+                feed_links = soup.find_all('link', type=_FEED_TYPE_RE)
+                feed_links.extend(soup.find_all('a', href=_FEED_HREF_RE))
                 
                 for link in feed_links:
                     href = link.get('href')
@@ -330,12 +803,12 @@ class ContentCrawler:
         urls = set()
         domain = urlparse(url).netloc
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    user_agent=self.ua.random,
-                    viewport={'width': 1920, 'height': 1080}
-                )
+            # Contexts are cheap; the browser behind them comes from the warm pool
+            async with self.browser_pool.new_context(
+                user_agent=self._next_ua(),
+                viewport={'width': 1920, 'height': 1080}
+            ) as context:
+                await context.route('**/*', _block_heavy_resources)
                 if site_config.custom_headers:
                     await context.set_extra_http_headers(site_config.custom_headers)
                 page = await context.new_page()
@@ -351,11 +824,18 @@ class ContentCrawler:
                         await page.wait_for_selector('.bg-white.p-\\[30px\\]', timeout=20000)
                     except:
                         pass
-                    for _ in range(15):
-                        await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-                        await asyncio.sleep(1)
-                    cards = await page.query_selector_all('.bg-white.p-\\[30px\\]')
+                    await self._scroll_until_stable(page, max_attempts=15, timeout_ms=1000)
+                    card_selector = '.bg-white.p-\\[30px\\]'
+                    # Read links the cards already carry in a single call; only click the ones without
+                    card_links = await page.evaluate(_CARD_LINKS_JS, card_selector)
+                    resolved = [bool(link and '/blog/' in link) for link in card_links]
+                    for post_url, is_post in zip(card_links, resolved):
+                        if is_post and post_url not in [url, url + '/']:
+                            urls.add(post_url)
+                    cards = await page.query_selector_all(card_selector) if not all(resolved) else []
                     for i, card in enumerate(cards):
+                        if i < len(resolved) and resolved[i]:
+                            continue
                         try:
                             button = await card.query_selector('button')
                             if button:
@@ -380,12 +860,7 @@ class ContentCrawler:
                                 continue
                     if site_config.infinite_scroll:
                         await self._handle_playwright_infinite_scroll(page, site_config)
-                    for selector in site_config.content_selectors:
-                        elements = await page.query_selector_all(selector)
-                        for element in elements:
-                            href = await element.get_attribute('href')
-                            if href and self._is_valid_content_url(href, site_config):
-                                urls.add(href)
+                    urls.update(await self._collect_page_hrefs(page, site_config))
                     page_num = 1
                     while page_num < self.max_pages:
                         next_page = self._get_next_page_url(url, page_num, site_config)
@@ -393,36 +868,26 @@ class ContentCrawler:
                             break
                         await page.goto(next_page, wait_until='networkidle')
                         await asyncio.sleep(site_config.scroll_pause_time)
-                        for selector in site_config.content_selectors:
-                            elements = await page.query_selector_all(selector)
-                            for element in elements:
-                                href = await element.get_attribute('href')
-                                if href and self._is_valid_content_url(href, site_config):
-                                    urls.add(href)
+                        urls.update(await self._collect_page_hrefs(page, site_config))
                         page_num += 1
-                await browser.close()
         except Exception as e:
             self.logger.error(f"Playwright crawl error: {str(e)}")
         return urls
 
     async def _crawl_with_undetected(self, url: str, site_config: SiteConfig) -> Set[str]:
         """Crawl using undetected-chromedriver to bypass anti-bot measures."""
+        return await self._run_blocking(self._sync_crawl_with_undetected, url, site_config, lock=self.uc_driver.lock)
+
+    def _sync_crawl_with_undetected(self, url: str, site_config: SiteConfig) -> Set[str]:
+        """Blocking body of _crawl_with_undetected, run on the crawler's thread pool."""
         urls = set()
         
         try:
-            options = uc.ChromeOptions()
-            options.add_argument('--headless')
-            options.add_argument(f'user-agent={self.ua.random}')
-            
-            if site_config.custom_headers:
-                for key, value in site_config.custom_headers.items():
-                    options.add_argument(f'--header={key}: {value}')
-            
-            driver = uc.Chrome(options=options)
+            driver = self.uc_driver.acquire(self._next_ua(), site_config.custom_headers)
             
             try:
                 driver.get(url)
-                time.sleep(site_config.scroll_pause_time)
+                self._wait_ready(driver, site_config)
                 
                 # Wait for content to load
                 if site_config.wait_for_selectors:
@@ -439,12 +904,7 @@ class ContentCrawler:
                     self._handle_infinite_scroll(driver, site_config)
                 
                 # Extract URLs
-                for selector in site_config.content_selectors:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        href = element.get_attribute('href')
-                        if href and self._is_valid_content_url(href, site_config):
-                            urls.add(href)
+                urls.update(self._collect_driver_hrefs(driver, site_config))
                 
                 # Handle pagination
                 page_num = 1
@@ -454,19 +914,14 @@ class ContentCrawler:
                         break
                     
                     driver.get(next_page)
-                    time.sleep(site_config.scroll_pause_time)
+                    self._wait_ready(driver, site_config)
                     
-                    for selector in site_config.content_selectors:
-                        elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            href = element.get_attribute('href')
-                            if href and self._is_valid_content_url(href, site_config):
-                                urls.add(href)
+                    urls.update(self._collect_driver_hrefs(driver, site_config))
                     
                     page_num += 1
                 
             finally:
-                driver.quit()
+                self.uc_driver.release(driver)
                 
         except Exception as e:
             self.logger.error(f"Undetected Chrome crawl error: {str(e)}")
@@ -475,22 +930,20 @@ class ContentCrawler:
 
     async def _crawl_with_cloudscraper(self, url: str, site_config: SiteConfig) -> Set[str]:
         """Crawl using cloudscraper to bypass Cloudflare protection."""
+        return await self._run_blocking(self._sync_crawl_with_cloudscraper, url, site_config)
+
+    def _sync_crawl_with_cloudscraper(self, url: str, site_config: SiteConfig) -> Set[str]:
+        """Blocking body of _crawl_with_cloudscraper, run on the crawler's thread pool."""
         urls = set()
         
         try:
-            headers = site_config.custom_headers or {}
-            headers['User-Agent'] = self.ua.random
+            # Copy so the rotating User-Agent never leaks into the shared site config
+            headers = {**(site_config.custom_headers or {}), 'User-Agent': self._next_ua()}
             
             response = self.scraper.get(url, headers=headers)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
                 # Extract URLs using selectors
-                for selector in site_config.content_selectors:
-                    for element in soup.select(selector):
-                        href = element.get('href')
-                        if href and self._is_valid_content_url(href, site_config):
-                            urls.add(href)
+                urls.update(self._select_hrefs(response.content, site_config))
                 
                 # Handle pagination
                 page_num = 1
@@ -501,12 +954,7 @@ class ContentCrawler:
                     
                     response = self.scraper.get(next_page, headers=headers)
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        for selector in site_config.content_selectors:
-                            for element in soup.select(selector):
-                                href = element.get('href')
-                                if href and self._is_valid_content_url(href, site_config):
-                                    urls.add(href)
+                        urls.update(self._select_hrefs(response.content, site_config))
                     page_num += 1
                     
         except Exception as e:
@@ -514,21 +962,45 @@ class ContentCrawler:
         
         return urls
 
+    async def _collect_page_hrefs(self, page, site_config: SiteConfig) -> Set[str]:
+        """Return the valid content hrefs on a Playwright page, gathered in one evaluate call."""
+        hrefs = await page.evaluate(_COLLECT_HREFS_JS, site_config.content_selectors)
+        return {href for href in hrefs if self._is_valid_content_url(href, site_config)}
+
+    def _collect_driver_hrefs(self, driver, site_config: SiteConfig) -> Set[str]:
+        """Return the valid content hrefs on a Selenium page, gathered in one execute_script call."""
+        hrefs = driver.execute_script(_SELENIUM_COLLECT_HREFS_JS, site_config.content_selectors)
+        return {href for href in hrefs if self._is_valid_content_url(href, site_config)}
+
     async def _handle_playwright_infinite_scroll(self, page, site_config: SiteConfig):
         """Handle infinite scroll using Playwright."""
-        last_height = await page.evaluate('document.body.scrollHeight')
-        attempts = 0
-        
-        while attempts < site_config.max_scroll_attempts:
+        await self._scroll_until_stable(
+            page,
+            max_attempts=site_config.max_scroll_attempts,
+            timeout_ms=int(site_config.scroll_pause_time * 1000)
+        )
+
+    async def _scroll_until_stable(self, page, max_attempts: int, timeout_ms: int):
+        """Scroll to the bottom until the page stops growing, waiting on DOM mutations rather than fixed sleeps."""
+        await page.evaluate(_WAIT_FOR_GROWTH_JS)
+        misses = 0
+        for _ in range(max_attempts):
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            await asyncio.sleep(site_config.scroll_pause_time)
-            
-            new_height = await page.evaluate('document.body.scrollHeight')
-            if new_height == last_height:
+            grew = await page.evaluate(f'window.__waitForGrowth({timeout_ms})')
+            # A single slow XHR shouldn't end the scroll; two quiet waits in a row do
+            misses = 0 if grew else misses + 1
+            if misses >= 2:
                 break
-                
-            last_height = new_height
-            attempts += 1
+
+    def _wait_ready(self, driver, site_config: SiteConfig, timeout: float = 10):
+        """Block until one of the site's first content selectors is present, instead of sleeping a fixed pause."""
+        selector = ','.join(site_config.content_selectors[:3])
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except TimeoutException:
+            self.logger.debug(f"No content selector appeared within {timeout}s on {driver.current_url}")
 
     def _handle_infinite_scroll(self, driver, site_config: SiteConfig):
         """Handle infinite scroll using Selenium."""
@@ -546,15 +1018,116 @@ class ContentCrawler:
             last_height = new_height
             attempts += 1
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the crawler's pooled HTTP session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=8,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+                resolver=aiohttp.AsyncResolver() if aiodns else None
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': self._next_ua()},
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.session
+
+    async def _fetch(self, url: str, headers: Optional[Dict[str, str]] = None, conditional: bool = False) -> Tuple[int, bytes]:
+        """GET a URL over the shared session and return its status code and raw body.
+
+        Responses are memoized for the rest of the crawl, so strategies probing the same URL
+        (even concurrently) share a single request. With conditional=True a body fresher than
+        the HTTP cache's expire_after is served from disk, otherwise the cached validators are
+        sent, a 304 is answered from the cache, and the cached copy stands in if the request fails.
+        """
+        # The rotating User-Agent doesn't change what the server sends back
+        key = (url, frozenset((k, v) for k, v in (headers or {}).items() if k.lower() != 'user-agent'))
+        task = self._fetch_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_uncached(url, headers, conditional))
+            self._fetch_cache[key] = task
+        # Shield so a cancelled (raced) strategy doesn't cancel the fetch for the others sharing it
+        return await asyncio.shield(task)
+
+    async def _fetch_uncached(self, url: str, headers: Optional[Dict[str, str]], conditional: bool) -> Tuple[int, bytes]:
+        """Perform the GET behind _fetch."""
+        session = await self._get_session()
+        cache = self.http_cache if conditional else None
+        # sqlite blocks, so every cache call runs on a worker thread
+        entry = await asyncio.to_thread(cache.get, url) if cache else None
+        if entry:
+            if cache.is_fresh(entry):
+                self.logger.debug(f"Fresh cache hit for {url}")
+                return 200, entry[2]
+            headers = {**(headers or {}), **cache.conditional_headers(entry)}
+        try:
+            async with session.get(url, headers=headers) as resp:
+                if resp.status == 304 and entry:
+                    self.logger.debug(f"Not modified, using cached body for {url}")
+                    await asyncio.to_thread(cache.touch, url)
+                    return 200, entry[2]
+                body = await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if not entry:
+                raise
+            self.logger.warning(f"Fetch failed, serving stale cached body for {url}")
+            return 200, entry[2]
+        if cache:
+            if resp.status == 200:
+                await asyncio.to_thread(cache.put, url, resp.headers.get('ETag'), resp.headers.get('Last-Modified'), body)
+            elif resp.status >= 500 and entry:
+                self.logger.warning(f"Got {resp.status}, serving stale cached body for {url}")
+                return 200, entry[2]
+        return resp.status, body
+
     async def _cleanup(self):
         """Clean up resources."""
+        for task in self._fetch_cache.values():
+            task.cancel()
+        self._fetch_cache.clear()
+        if self.session:
+            await self.session.close()
+            self.session = None
         if self.driver:
-            self.driver.quit()
-            self.driver = None
+            await self._run_blocking(self._quit_driver, lock=self._driver_lock)
         if self.playwright:
             await self.playwright.close()
             self.playwright = None
 
+    async def close(self):
+        """Release everything the crawler holds, including its browser pool if it owns it."""
+        await self._cleanup()
+        self._executor.shutdown(wait=False)
+        if self._owns_browser_pool:
+            await self.browser_pool.close()
+        if self._owns_uc_driver:
+            await self.uc_driver.close()
+        if self.http_cache:
+            await asyncio.to_thread(self.http_cache.close)
+            self.http_cache = None
+
+    async def _run_blocking(self, func, *args, lock: Optional[threading.Lock] = None):
+        """Run blocking driver/HTTP work on the crawler's thread pool so the event loop stays free.
+
+        The lock is taken inside the worker thread, so a driver is never shared between threads
+        even if the awaiting coroutine is cancelled.
+        """
+        def call():
+            if lock is None:
+                return func(*args)
+            with lock:
+                return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    def _quit_driver(self):
+        """Quit the shared Selenium driver, if any."""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
     def _init_browser(self):
         """Initialize the browser if not already initialized."""
         if not self.driver:
@@ -562,6 +1135,7 @@ class ContentCrawler:
             chrome_options.add_argument('--headless')
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
+            chrome_options.add_experimental_option('prefs', _NO_IMAGES_CHROME_PREFS)
             # Use WebDriverManager to get the path, but ensure we use chromedriver.exe, not a text file
             driver_path = ChromeDriverManager().install()
             # On Windows, ensure we use chromedriver.exe
@@ -577,6 +1151,10 @@ class ContentCrawler:
 
     async def _crawl_with_selenium(self, url: str, site_config: SiteConfig) -> Set[str]:
         """Crawl using Selenium for JavaScript-heavy sites."""
+        return await self._run_blocking(self._sync_crawl_with_selenium, url, site_config, lock=self._driver_lock)
+
+    def _sync_crawl_with_selenium(self, url: str, site_config: SiteConfig) -> Set[str]:
+        """Blocking body of _crawl_with_selenium, run on the crawler's thread pool."""
         if not site_config.requires_js:
             return set()
             
@@ -585,19 +1163,14 @@ class ContentCrawler:
         
         try:
             self.driver.get(url)
-            time.sleep(2)  # Initial load wait
+            self._wait_ready(self.driver, site_config)
             
             # Handle infinite scroll
             if site_config.infinite_scroll:
-                self._handle_infinite_scroll()
+                self._handle_infinite_scroll(self.driver, site_config)
             
             # Extract URLs using selectors
-            for selector in site_config.content_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                for element in elements:
-                    href = element.get_attribute('href')
-                    if href and self._is_valid_content_url(href, site_config):
-                        urls.add(href)
+            urls.update(self._collect_driver_hrefs(self.driver, site_config))
             
             # Handle pagination
             page = 1
@@ -607,14 +1180,9 @@ class ContentCrawler:
                     break
                     
                 self.driver.get(next_page)
-                time.sleep(2)
+                self._wait_ready(self.driver, site_config)
                 
-                for selector in site_config.content_selectors:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        href = element.get_attribute('href')
-                        if href and self._is_valid_content_url(href, site_config):
-                            urls.add(href)
+                urls.update(self._collect_driver_hrefs(self.driver, site_config))
                 
                 page += 1
                 
@@ -634,9 +1202,9 @@ class ContentCrawler:
         try:
             for endpoint in site_config.api_endpoints:
                 api_url = f"https://{domain}{endpoint}"
-                response = requests.get(api_url)
-                if response.status_code == 200:
-                    data = response.json()
+                status, body = await self._fetch(api_url, conditional=True)
+                if status == 200:
+                    data = json.loads(body)
                     urls.update(self._extract_urls_from_api_response(data, site_config))
         except Exception as e:
             self.logger.error(f"API crawl error: {str(e)}")
@@ -648,16 +1216,10 @@ class ContentCrawler:
         urls = set()
         
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
+            status, body = await self._fetch(url, conditional=True)
+            if status == 200:
                 # Extract URLs using selectors
-                for selector in site_config.content_selectors:
-                    for element in soup.select(selector):
-                        href = element.get('href')
-                        if href and self._is_valid_content_url(href, site_config):
-                            urls.add(href)
+                urls.update(await self._select_hrefs_async(body, site_config))
                             
                 # Handle pagination
                 page = 1
@@ -666,14 +1228,9 @@ class ContentCrawler:
                     if not next_page:
                         break
                         
-                    response = requests.get(next_page)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        for selector in site_config.content_selectors:
-                            for element in soup.select(selector):
-                                href = element.get('href')
-                                if href and self._is_valid_content_url(href, site_config):
-                                    urls.add(href)
+                    status, body = await self._fetch(next_page, conditional=True)
+                    if status == 200:
+                        urls.update(await self._select_hrefs_async(body, site_config))
                     page += 1
                     
         except Exception as e:
@@ -681,6 +1238,20 @@ class ContentCrawler:
             
         return urls
 
+    def _select_hrefs(self, html, site_config: SiteConfig) -> Set[str]:
+        """Return the valid content hrefs matched by the site's content selectors."""
+        hrefs = _parse_html(html, tuple(site_config.content_selectors))
+        return {href for href in hrefs if self._is_valid_content_url(href, site_config)}
+
+    async def _select_hrefs_async(self, html, site_config: SiteConfig) -> Set[str]:
+        """Like _select_hrefs, but parses very large pages in a worker process so the event loop stays responsive."""
+        if len(html) <= _PROCESS_PARSE_THRESHOLD:
+            return self._select_hrefs(html, site_config)
+        hrefs = await asyncio.get_running_loop().run_in_executor(
+            _get_parse_pool(), _parse_html, html, tuple(site_config.content_selectors)
+        )
+        return {href for href in hrefs if self._is_valid_content_url(href, site_config)}
+
     def _get_site_config(self, domain: str) -> SiteConfig:
         """Get site-specific configuration."""
         for config in self.site_configs.values():
@@ -695,16 +1266,16 @@ class ContentCrawler:
 
     def _is_valid_content_url(self, url: str, site_config: SiteConfig) -> bool:
         """Check if URL is a valid content URL based on site configuration."""
-        if not url or url in self.visited_urls:
+        if not url:
             return False
-            
-        self.visited_urls.add(url)
-        
-        # Check against content patterns
-        for pattern in site_config.content_patterns:
-            if re.search(pattern, url):
-                return True
-                
+        with self._visited_lock:
+            if url in self.visited_urls:
+                return False
+            # Check against content patterns
+            for pattern in site_config._compiled_patterns:
+                if pattern.search(url):
+                    self.visited_urls.add(url)
+                    return True
         return False
 
     def _get_next_page_url(self, base_url: str, page: int, site_config: SiteConfig) -> Optional[str]:
@@ -717,23 +1288,28 @@ class ContentCrawler:
     def _extract_urls_from_api_response(self, data: dict, site_config: SiteConfig) -> Set[str]:
         """Extract URLs from API response data."""
         urls = set()
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, str) and self._is_valid_content_url(value, site_config):
-                    urls.add(value)
-                elif isinstance(value, (dict, list)):
-                    urls.update(self._extract_urls_from_api_response(value, site_config))
-        elif isinstance(data, list):
-            for item in data:
-                urls.update(self._extract_urls_from_api_response(item, site_config))
+        is_valid = self._is_valid_content_url
+        # Walk the response with an explicit stack; only string values of dicts are URL candidates
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for value in node.values():
+                    if isinstance(value, str):
+                        if is_valid(value, site_config):
+                            urls.add(value)
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(item for item in node if isinstance(item, (dict, list)))
         return urls
 
     def _determine_content_type(self, url: str) -> ContentType:
         """Determine the content type based on URL patterns."""
         url_lower = url.lower()
         
-        for content_type, pattern in self.site_configs.items():
-            if any(re.search(p, url_lower) for p in pattern.content_patterns):
+        for content_type, pattern in self._flat_type_patterns:
+            if pattern.search(url_lower):
                 return content_type
         
         # Check for common blog indicators
@@ -753,25 +1329,29 @@ class ContentCrawler:
             f'https://{domain}/api/articles',
             f'https://{domain}/api/blog-articles',
         ]
-        headers = site_config.custom_headers or {}
-        headers['User-Agent'] = self.ua.random
-        for api_url in api_candidates:
+        # Copy so the rotating User-Agent never leaks into the shared site config
+        headers = {**(site_config.custom_headers or {}), 'User-Agent': self._next_ua()}
+        # Probe every candidate endpoint at once over the pooled session
+        responses = await asyncio.gather(
+            *(self._fetch(api_url, headers=headers, conditional=True) for api_url in api_candidates),
+            return_exceptions=True
+        )
+        for api_url, response in zip(api_candidates, responses):
             try:
-                resp = requests.get(api_url, headers=headers, timeout=10)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    # Recursively extract all URLs containing '/blog/'
-                    def extract_blog_urls(obj):
-                        if isinstance(obj, dict):
-                            for v in obj.values():
-                                extract_blog_urls(v)
-                        elif isinstance(obj, list):
-                            for item in obj:
-                                extract_blog_urls(item)
-                        elif isinstance(obj, str):
-                            if '/blog/' in obj:
-                                urls.add(obj)
-                    extract_blog_urls(data)
+                if isinstance(response, Exception):
+                    raise response
+                status, body = response
+                if status == 200:
+                    # Walk the JSON iteratively, collecting every string containing '/blog/'
+                    stack = [json.loads(body)]
+                    while stack:
+                        node = stack.pop()
+                        if isinstance(node, dict):
+                            stack.extend(node.values())
+                        elif isinstance(node, list):
+                            stack.extend(node)
+                        elif isinstance(node, str) and '/blog/' in node:
+                            urls.add(node)
             except Exception as e:
                 self.logger.debug(f"[Quill API] Failed to fetch {api_url}: {str(e)}")
         return urls
@@ -780,74 +1360,82 @@ class ContentCrawler:
         """Try to extract blog post URLs from static HTML using BeautifulSoup heuristics for Quill."""
         urls = set()
         domain = urlparse(url).netloc
+        # Copy so the rotating User-Agent never leaks into the shared site config
+        headers = {**(site_config.custom_headers or {}), 'User-Agent': self._next_ua()}
+        sitemap_url = f'https://{domain}/sitemap.xml'
+        # Fetch the page and the sitemap fallback together instead of back to back
+        page_response, sitemap_response = await asyncio.gather(
+            self._fetch(url, headers=headers, conditional=True),
+            self._fetch(sitemap_url, headers=headers, conditional=True),
+            return_exceptions=True
+        )
         try:
-            headers = site_config.custom_headers or {}
-            headers['User-Agent'] = self.ua.random
-            resp = requests.get(url, headers=headers, timeout=10)
-            if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                # Find all blog post cards (improved: handle both class and main content area)
-                cards = soup.find_all('div', class_='bg-white')
-                for card in cards:
-                    # Try to find the title
-                    h = card.find(['h1', 'h2', 'h3', 'h4'])
-                    title = h.get_text(strip=True) if h else None
-                    # Try to find a button with 'Read more' text
-                    button = card.find('button', string=lambda s: s and 'read more' in s.lower())
-                    # Try to find a data attribute or reconstruct a slug
-                    if title:
-                        slug = title.lower().replace(' ', '-').replace('?', '').replace('.', '').replace(',', '').replace("'", "")
-                        candidate_url = f'https://{domain}/blog/{slug}'
-                        urls.add(candidate_url)
-                # Also look for all headings in the main content area
+            if isinstance(page_response, Exception):
+                raise page_response
+            status, body = page_response
+            if status == 200:
+                soup = BeautifulSoup(body, HTML_PARSER)
+                # Headings to turn into slugs: each blog card's title, then every heading in the main content area
+                headings = [card.find(['h1', 'h2', 'h3', 'h4']) for card in soup.find_all('div', class_='bg-white')]
                 main = soup.find('main') or soup
-                for h in main.find_all(['h1', 'h2', 'h3', 'h4']):
-                    title = h.get_text(strip=True)
-                    if title:
-                        slug = title.lower().replace(' ', '-').replace('?', '').replace('.', '').replace(',', '').replace("'", "")
-                        candidate_url = f'https://{domain}/blog/{slug}'
-                        urls.add(candidate_url)
+                headings.extend(main.find_all(['h1', 'h2', 'h3', 'h4']))
+                titles = (h.get_text(strip=True) for h in headings if h)
+                urls.update(f'https://{domain}/blog/{title.lower().translate(_SLUG_TRANS)}' for title in titles if title)
         except Exception as e:
             self.logger.debug(f"[Quill BeautifulSoup] Failed to parse static HTML: {str(e)}")
         # Try sitemap.xml as a last fallback
         try:
-            sitemap_url = f'https://{domain}/sitemap.xml'
-            resp = requests.get(sitemap_url, headers=headers, timeout=10)
-            if resp.status_code == 200:
-                soup = BeautifulSoup(resp.text, 'xml')
-                for loc in soup.find_all('loc'):
-                    loc_url = loc.get_text()
+            if isinstance(sitemap_response, Exception):
+                raise sitemap_response
+            status, body = sitemap_response
+            if status == 200:
+                for loc_url in _iter_sitemap_locs(body):
                     if '/blog/' in loc_url:
                         urls.add(loc_url)
         except Exception as e:
             self.logger.debug(f"[Quill BeautifulSoup] Failed to parse sitemap.xml: {str(e)}")
         return urls
 
-    async def _crawl_with_aggressive_selenium(self, url: str, site_config: SiteConfig) -> Set[str]:
-        """Aggressive Selenium fallback: render, scroll, and extract all <a> tags as content URLs."""
+    async def _crawl_with_aggressive_playwright(self, url: str, site_config: SiteConfig) -> Set[str]:
+        """Aggressive fallback: render, scroll until the page stops growing, and take every <a> as a content URL candidate."""
         urls = set()
         try:
-            self._init_browser()
-            self.driver.get(url)
-            for _ in range(15):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
-            anchors = self.driver.find_elements(By.TAG_NAME, "a")
-            for a in anchors:
-                href = a.get_attribute('href')
-                if href and self._is_valid_content_url(href, site_config):
-                    urls.add(href)
-            self.driver.quit()
+            async with self.browser_pool.new_context(user_agent=self._next_ua()) as context:
+                await context.route('**/*', _block_heavy_resources)
+                if site_config.custom_headers:
+                    await context.set_extra_http_headers(site_config.custom_headers)
+                page = await context.new_page()
+                await page.goto(url, wait_until='networkidle')
+                await self._scroll_until_stable(page, max_attempts=15, timeout_ms=1000)
+                # Every resolved href in one round trip instead of one attribute read per anchor
+                hrefs = await page.eval_on_selector_all('a[href]', '(els) => els.map(e => e.href)')
+                urls.update(href for href in hrefs if self._is_valid_content_url(href, site_config))
         except Exception as e:
-            self.logger.error(f"Aggressive Selenium crawl error: {str(e)}")
+            self.logger.error(f"Aggressive Playwright crawl error: {str(e)}")
         return urls
 
     def _extract_all_links(self, html, base_url):
         """Extract all <a href> links from the page."""
-        soup = BeautifulSoup(html, 'html.parser')
+        if LexborHTMLParser is not None:
+            # selectolax matches the anchors in C; only the hrefs become Python strings
+            links = set()
+            for node in LexborHTMLParser(html).css('a[href]'):
+                full_url = _absolute_url(base_url, node.attributes['href'] or '')
+                if full_url.startswith('http'):
+                    links.add(full_url)
+            return links
+        if lxml_html is not None:
+            # lxml resolves and walks the links in C without building a soup
+            doc = lxml_html.fromstring(html)
+            doc.make_links_absolute(base_url, handle_failures='discard')
+            return {
+                link for element, attribute, link, _ in doc.iterlinks()
+                if element.tag == 'a' and attribute == 'href' and link.startswith('http')
+            }
+        soup = BeautifulSoup(html, HTML_PARSER)
         links = set()
         for tag in soup.find_all('a', href=True):
-            full_url = urljoin(base_url, tag['href'])
+            full_url = _absolute_url(base_url, tag['href'])
             if full_url.startswith('http'):
                 links.add(full_url)
         return links
\ No newline at end of file
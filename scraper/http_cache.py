@@ -0,0 +1,73 @@
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# (etag, last_modified, body, fetched_at) as stored for one URL
+CacheEntry = Tuple[Optional[str], Optional[str], bytes, float]
+
+class HTTPCache:
+    """Persist ETag / Last-Modified validators and bodies per URL for conditional GETs.
+
+    Methods block on sqlite; call them from a worker thread (e.g. asyncio.to_thread), not the event loop.
+    """
+
+    def __init__(self, path: str = 'ogscaper_cache.sqlite', expire_after: Optional[float] = 3600):
+        self.path = path
+        # Bodies younger than this many seconds are served without revalidating (None: always revalidate)
+        self.expire_after = expire_after
+        # Several crawlers and server workers may share the file: wait on locks instead of failing
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # WAL lets readers proceed while another connection writes
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS http_cache ('
+            'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, fetched_at REAL)'
+        )
+        self._conn.commit()
+        # The connection is used from whichever worker thread runs the call
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached (etag, last_modified, body, fetched_at) for a URL, if any."""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT etag, last_modified, body, fetched_at FROM http_cache WHERE url = ?', (url,)
+            ).fetchone()
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry is young enough to serve without revalidating."""
+        return self.expire_after is not None and entry[3] >= time.time() - self.expire_after
+
+    def touch(self, url: str):
+        """Mark a cached body as just revalidated."""
+        with self._lock:
+            self._conn.execute('UPDATE http_cache SET fetched_at = ? WHERE url = ?', (time.time(), url))
+            self._conn.commit()
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes):
+        """Store the validators and body returned for a URL."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (url, etag, last_modified, body, time.time())
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a cached entry's validators."""
+        if not entry:
+            return {}
+        etag, last_modified = entry[0], entry[1]
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
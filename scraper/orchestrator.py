@@ -1,64 +1,165 @@
-from typing import List, Dict, Type
+from typing import List, Dict, Optional, Type
 from .base import BaseScraper, ScraperResult, ContentItem
 from .blog_scraper import BlogScraper
-from .pdf_scraper import PDFScraper
-from .content_crawler import ContentCrawler, ContentType
+from .pdf_scraper import PDFScraper, shutdown_extract_pool
+from .content_crawler import BrowserPool, ContentCrawler, ContentType, UCDriverHolder, shutdown_parse_pool
 import asyncio
-from tqdm import tqdm
-import json
+import aiohttp
+from contextlib import asynccontextmanager
+from tqdm.asyncio import tqdm_asyncio
+import msgspec
 from pathlib import Path
 import logging
 import re
 import os
+import hashlib
+from operator import attrgetter
+from pybloom_live import BloomFilter
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Crawls can each drive a browser, so keep far fewer of them in flight than plain page scrapes
+CRAWL_CONCURRENCY = 4
+SCRAPE_CONCURRENCY = 16
+
+async def _bounded(sem: asyncio.Semaphore, coro):
+    """Await coro while holding a slot of sem."""
+    async with sem:
+        return await coro
+
+# Only these fields of each item are written to the output file, in this order
+_OUTPUT_FIELDS = ('title', 'content', 'content_type', 'source_url', 'author', 'user_id')
+_get_output_fields = attrgetter(*_OUTPUT_FIELDS)
+
+# Digits (dates, counters) and markup vary between otherwise identical pages
+_FINGERPRINT_STRIP_RE = re.compile(r'\d+|<[^>]+>')
+
+def _fingerprint(content: str) -> str:
+    """Return a cheap 128-bit fingerprint of content, ignoring digits and tags."""
+    data = _FINGERPRINT_STRIP_RE.sub('', content).encode('utf-8')
+    if blake3 is not None:
+        return blake3(data).digest()[:16].hex()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 class ScraperOrchestrator:
-    def __init__(self, team_id: str):
+    def __init__(
+        self,
+        team_id: str,
+        browser_pool: Optional[BrowserPool] = None,
+        uc_driver: Optional[UCDriverHolder] = None,
+        cache_path: Optional[str] = 'ogscaper_cache.sqlite',
+        cache_expire_after: Optional[float] = None
+    ):
         self.team_id = team_id
         self.scrapers: List[BaseScraper] = [
             BlogScraper(team_id),
             PDFScraper(team_id)
         ]
         self.logger = logging.getLogger(__name__)
-        self.content_crawler = ContentCrawler()
+        # Every crawl gets its own ContentCrawler, but they all borrow browsers from this pool
+        # and share one warm undetected-chromedriver; injected ones belong to the caller
+        self._owns_browser_pool = browser_pool is None
+        self.browser_pool = browser_pool or BrowserPool()
+        self._owns_uc_driver = uc_driver is None
+        self.uc_driver = uc_driver or UCDriverHolder()
+        # Handed to every crawler, so repeat runs revalidate feeds and listing pages with conditional
+        # GETs; cached bodies are only served unrevalidated once cache_expire_after is set (None: cache off)
+        self.cache_path = cache_path
+        self.cache_expire_after = cache_expire_after
 
     async def scrape_urls(self, urls: List[str]) -> ScraperResult:
         """Scrape multiple URLs and return the results."""
         all_items = []
-        all_urls_to_scrape = []
+        # Local PDF files go directly to PDFScraper; everything else is crawled for content links
+        site_urls = [url for url in urls if not (os.path.isfile(url) and url.lower().endswith('.pdf'))]
+        crawl_sem = asyncio.Semaphore(CRAWL_CONCURRENCY)
+        crawled_list = await asyncio.gather(*[_bounded(crawl_sem, self.crawl_one(url)) for url in site_urls])
+        crawled_by_url = dict(zip(site_urls, crawled_list))
+        # Collect (url, base_url) pairs, dropping duplicates as they are found
+        seen = set()
+        unique_urls = []
         for url in urls:
-            # If it's a local PDF file, pass directly to PDFScraper
-            if os.path.isfile(url) and url.lower().endswith('.pdf'):
-                all_urls_to_scrape.append((url, url))
-                continue
-            # Crawl for content links
-            crawled = await self.content_crawler.crawl(url)
             # Always add the main page as well (in case it's a content page itself)
-            all_urls_to_scrape.append((url, url))
-            for ct, found_urls in crawled.items():
+            if url not in seen:
+                seen.add(url)
+                unique_urls.append((url, url))
+            for ct, found_urls in crawled_by_url.get(url, {}).items():
                 for found_url in found_urls:
-                    all_urls_to_scrape.append((found_url, url))
-        # Remove duplicates
-        seen = set()
-        unique_urls = []
-        for found_url, base_url in all_urls_to_scrape:
-            if found_url not in seen:
-                unique_urls.append((found_url, base_url))
-                seen.add(found_url)
-        # Scrape each URL
-        for found_url, base_url in tqdm(unique_urls, desc="Scraping URLs"):
-            scraper = self._get_scraper_for_url(found_url)
-            if scraper:
-                try:
-                    items = await scraper.scrape(found_url, base_url=base_url)
-                    all_items.extend(items)
-                except Exception as e:
-                    self.logger.error(f"Error scraping {found_url}: {str(e)}")
-                    continue
+                    if found_url not in seen:
+                        seen.add(found_url)
+                        unique_urls.append((found_url, url))
+        # Scrape the URLs concurrently over one pooled session shared by all scrapers
+        async with self.shared_session():
+            scrape_sem = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+            results = await tqdm_asyncio.gather(
+                *[_bounded(scrape_sem, self.scrape_one(found_url, base_url=base_url)) for found_url, base_url in unique_urls],
+                desc="Scraping URLs"
+            )
+            # Dedupe in URL order so the same copy wins regardless of which scrape finished first
+            fingerprints = self.new_fingerprint_filter()
+            for items in results:
+                all_items.extend(self.dedupe_content(items, fingerprints))
         return ScraperResult(
             team_id=self.team_id,
             items=all_items
         )
 
+    async def crawl_one(self, url: str) -> Dict[ContentType, List[str]]:
+        """Crawl a site for content links with a dedicated crawler on the shared browsers."""
+        crawler = ContentCrawler(
+            cache_path=self.cache_path,
+            browser_pool=self.browser_pool,
+            uc_driver=self.uc_driver,
+            cache_expire_after=self.cache_expire_after
+        )
+        try:
+            return await crawler.crawl(url)
+        finally:
+            await crawler.close()
+
+    async def scrape_one(self, url: str, base_url: Optional[str] = None) -> List[ContentItem]:
+        """Scrape a single URL with the matching scraper, returning no items on failure."""
+        scraper = self._get_scraper_for_url(url)
+        if not scraper:
+            return []
+        try:
+            return await scraper.scrape(url, base_url=base_url)
+        except Exception as e:
+            self.logger.error(f"Error scraping {url}: {str(e)}")
+            return []
+
+    def new_fingerprint_filter(self) -> BloomFilter:
+        """Create an empty content-fingerprint filter for one scrape run."""
+        return BloomFilter(capacity=1_000_000, error_rate=0.001)
+
+    def dedupe_content(self, items: List[ContentItem], fingerprints: BloomFilter) -> List[ContentItem]:
+        """Drop items whose content was already seen in this run (e.g. re-exposed by pagination)."""
+        unique_items = []
+        for item in items:
+            fingerprint = _fingerprint(item.content)
+            if fingerprint in fingerprints:
+                self.logger.debug(f"Skipping duplicate content from {item.source_url}")
+                continue
+            fingerprints.add(fingerprint)
+            unique_items.append(item)
+        return unique_items
+
+    @asynccontextmanager
+    async def shared_session(self):
+        """Share one pooled aiohttp session across all scrapers for the duration of the block."""
+        connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            for scraper in self.scrapers:
+                scraper.session = session
+            try:
+                yield session
+            finally:
+                for scraper in self.scrapers:
+                    scraper.session = None
+
     def _get_scraper_for_url(self, url: str) -> BaseScraper:
         """Find the appropriate scraper for a given URL."""
         for scraper in self.scrapers:
@@ -70,26 +171,28 @@ class ScraperOrchestrator:
         """Save scraping results to a JSON file in the required schema."""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        # Only include required fields in each item
-        output = {
-            "team_id": result.team_id,
-            "items": [
-                {
-                    "title": item.title,
-                    "content": item.content,
-                    "content_type": item.content_type,
-                    "source_url": item.source_url,
-                    "author": item.author,
-                    "user_id": item.user_id
-                }
-                for item in result.items
-            ]
-        }
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Stream one item at a time through msgspec's C encoder instead of building the whole document first
+        encoder = msgspec.json.Encoder()
+        with open(output_path, 'wb') as f:
+            f.write(b'{\n  "team_id": ' + encoder.encode(result.team_id) + b',\n  "items": [')
+            records = (dict(zip(_OUTPUT_FIELDS, _get_output_fields(item))) for item in result.items)
+            for idx, record in enumerate(records):
+                # Strings never contain raw newlines, so re-indenting the formatted record is safe
+                f.write(b',\n    ' if idx else b'\n    ')
+                f.write(msgspec.json.format(encoder.encode(record), indent=2).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}' if result.items else b']\n}')
 
     async def scrape_and_save(self, urls: List[str], output_path: str):
         """Scrape URLs and save results to a file."""
-        result = await self.scrape_urls(urls)
+        try:
+            result = await self.scrape_urls(urls)
+        finally:
+            if self._owns_browser_pool:
+                await self.browser_pool.close()
+            if self._owns_uc_driver:
+                await self.uc_driver.close()
+            # The parse and PDF extraction pools are process-wide; the run is over, so stop their workers
+            await asyncio.to_thread(shutdown_parse_pool)
+            await asyncio.to_thread(shutdown_extract_pool)
         self.save_results(result, output_path)
         return result 
\ No newline at end of file
@@ -1,19 +1,76 @@
 import PyPDF2
+import aiohttp
 from typing import List, Optional, Tuple
-from .base import BaseScraper, ContentItem
+from .base import BaseScraper, ContentItem, PROCESS_POOL_CONTEXT
 import re
 from pathlib import Path
 import os
-import requests
+import asyncio
+import logging
+import tempfile
 from io import BytesIO
+from urllib.parse import urlparse
 from datetime import datetime
 import pdfplumber
 import html2text
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+_h2t_local = threading.local()
+
+# Documents with at least this many pages are extracted across worker processes
+_PARALLEL_PAGE_THRESHOLD = 8
+_extract_pool: Optional[ProcessPoolExecutor] = None
+
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+# Whole lines made only of repeated dots or similar filler (e.g. table-of-contents leaders):
+# at least five characters between the first and last filler mark, surrounding spaces allowed
+_FILLER_LINE_RE = re.compile(r'^[^\S\n]*[.·•\-](?:[^\S\n]|[.·•\-]){3,}[.·•\-][^\S\n]*(?:\n|$)', re.MULTILINE)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PARAGRAPH_BREAK_RE = re.compile(r'([.!?])\s+([A-Z])')
+# Common chapter title patterns
+_CHAPTER_TITLE_RES = [
+    re.compile(r'^Chapter\s+\d+[.:]\s*(.+)$', re.IGNORECASE),
+    re.compile(r'^\d+[.:]\s*(.+)$', re.IGNORECASE),
+    re.compile(r'^[IVX]+[.:]\s*(.+)$', re.IGNORECASE),
+]
+
+def _get_h2t() -> html2text.HTML2Text:
+    """Return this thread's configured HTML2Text converter, building it on first use."""
+    h2t = getattr(_h2t_local, 'h2t', None)
+    if h2t is None:
+        h2t = html2text.HTML2Text()
+        h2t.ignore_links = False
+        h2t.ignore_images = True
+        h2t.body_width = 0
+        _h2t_local.h2t = h2t
+    return h2t
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """Return the shared page extraction process pool, starting it on first use."""
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=PROCESS_POOL_CONTEXT)
+    return _extract_pool
+
+def shutdown_extract_pool():
+    """Stop the shared page extraction process pool, if started; the next large PDF starts a new one."""
+    global _extract_pool
+    if _extract_pool is not None:
+        _extract_pool.shutdown(cancel_futures=True)
+        _extract_pool = None
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract the text of pages [start, stop) of a PDF, opening it afresh in the worker."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
 
 class PDFScraper(BaseScraper):
-    def __init__(self, team_id: str, chunk_size: int = 1000):
-        super().__init__(team_id)
+    def __init__(self, team_id: str, chunk_size: int = 1000, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(team_id, session=session)
         self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
 
     def can_handle(self, url: str) -> bool:
         """Check if the URL points to a PDF file."""
@@ -22,74 +79,102 @@ class PDFScraper(BaseScraper):
     async def scrape(self, url: str, base_url: str = None) -> List[ContentItem]:
         """Scrape content from a PDF file using pdfplumber, clean and output as markdown, split into sentence-aligned chunks, and remove filler lines."""
         items = []
-        h2t = html2text.HTML2Text()
-        h2t.ignore_links = False
-        h2t.ignore_images = True
-        h2t.body_width = 0
+        h2t = _get_h2t()
         try:
             # Support both local file and URL
             if url.lower().startswith('http'):
-                response = requests.get(url)
-                with open('temp_downloaded.pdf', 'wb') as f:
-                    f.write(response.content)
-                pdf_path = 'temp_downloaded.pdf'
+                # Keep the download in memory; pdfplumber reads file-like objects directly
+                if self.session is not None:
+                    pdf_source = await self._download(self.session, url)
+                else:
+                    async with aiohttp.ClientSession() as session:
+                        pdf_source = await self._download(session, url)
+                pdf_name = os.path.basename(urlparse(url).path) or url
             else:
-                pdf_path = url
-            with pdfplumber.open(pdf_path) as pdf:
-                full_text = ""
-                for page in pdf.pages:
-                    text = page.extract_text() or ""
-                    full_text += text + "\n"
+                pdf_source = url
+                pdf_name = os.path.basename(url)
+            with pdfplumber.open(pdf_source) as pdf:
+                n_pages = len(pdf.pages)
+                if n_pages < _PARALLEL_PAGE_THRESHOLD:
+                    texts = [page.extract_text() or "" for page in pdf.pages]
+            if n_pages >= _PARALLEL_PAGE_THRESHOLD:
+                texts = await self._extract_pages_parallel(pdf_source, n_pages)
+            full_text = "\n".join(texts)
             # Clean up the text
-            full_text = re.sub(r'\n{3,}', '\n\n', full_text.strip())
+            full_text = _MULTI_NEWLINE_RE.sub('\n\n', full_text.strip())
             # Remove lines that are only repeated dots or similar filler
-            full_text = '\n'.join(
-                line for line in full_text.splitlines()
-                if not re.fullmatch(r'[.\s·•\-]{5,}', line.strip())
-            )
+            full_text = _FILLER_LINE_RE.sub('', full_text)
             # Convert to markdown
             markdown = h2t.handle(full_text)
-            markdown = re.sub(r'\n{3,}', '\n\n', markdown.strip())
+            markdown = _MULTI_NEWLINE_RE.sub('\n\n', markdown.strip())
             # Remove lines that are only repeated dots or similar filler in markdown too
-            markdown = '\n'.join(
-                line for line in markdown.splitlines()
-                if not re.fullmatch(r'[.\s·•\-]{5,}', line.strip())
-            )
+            markdown = _FILLER_LINE_RE.sub('', markdown)
             # Split into sentence-aligned chunks (6000 chars max, but only at sentence boundaries)
             chunk_size = 6000
-            sentences = re.split(r'(?<=[.!?])\s+', markdown)
+            sentences = _SENTENCE_SPLIT_RE.split(markdown)
             chunks = []
-            current_chunk = ""
+            # Collect each chunk's sentences in a list with a running length, joining once per chunk
+            buf = []
+            buf_len = 0
             for sentence in sentences:
                 if not sentence.strip():
                     continue
-                if len(current_chunk) + len(sentence) + 1 <= chunk_size:
-                    if current_chunk:
-                        current_chunk += " " + sentence
-                    else:
-                        current_chunk = sentence
+                add = len(sentence) + (1 if buf else 0)
+                if buf_len + add > chunk_size and buf:
+                    chunks.append(" ".join(buf).strip())
+                    buf = [sentence]
+                    buf_len = len(sentence)
                 else:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = sentence
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+                    buf.append(sentence)
+                    buf_len += add
+            if buf:
+                chunks.append(" ".join(buf).strip())
             for idx, chunk in enumerate(chunks):
                 items.append(ContentItem(
-                    title=f"{os.path.basename(pdf_path)} (part {idx+1})" if len(chunks) > 1 else os.path.basename(pdf_path),
+                    title=f"{pdf_name} (part {idx+1})" if len(chunks) > 1 else pdf_name,
                     content=chunk,
                     content_type="blog",  # or "other" or "pdf" if you want
                     source_url=url,
                     author="",
                     user_id=""
                 ))
-            # Clean up temp file if used
-            if url.lower().startswith('http'):
-                os.remove('temp_downloaded.pdf')
             return items
         except Exception as e:
             self.logger.error(f"Error scraping PDF {url}: {str(e)}")
             return []
 
+    async def _extract_pages_parallel(self, pdf_source, n_pages: int) -> List[str]:
+        """Extract page text in contiguous page ranges, one per worker process."""
+        temp_path = None
+        if isinstance(pdf_source, BytesIO):
+            # Workers open the document by path, so spill the downloaded bytes to disk once
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+                f.write(pdf_source.getbuffer())
+                temp_path = f.name
+        pdf_path = temp_path or pdf_source
+        try:
+            loop = asyncio.get_running_loop()
+            pool = _get_extract_pool()
+            step = -(-n_pages // (os.cpu_count() or 1))
+            ranges = await asyncio.gather(*(
+                loop.run_in_executor(pool, _extract_page_range, pdf_path, start, min(start + step, n_pages))
+                for start in range(0, n_pages, step)
+            ))
+        finally:
+            if temp_path:
+                os.remove(temp_path)
+        return [text for texts in ranges for text in texts]
+
+    async def _download(self, session: aiohttp.ClientSession, url: str) -> BytesIO:
+        """Stream a remote PDF into an in-memory buffer with the given session."""
+        buf = BytesIO()
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                buf.write(chunk)
+        buf.seek(0)
+        return buf
+
     def _process_pdf(self, pdf_file: BytesIO, source_url: str) -> List[ContentItem]:
         """Process PDF content and return chunks as ContentItems."""
         reader = PyPDF2.PdfReader(pdf_file)
@@ -162,16 +247,9 @@ class PDFScraper(BaseScraper):
 
     def _detect_chapter_title(self, text: str) -> Optional[str]:
         """Detect if the text contains a chapter title."""
-        # Common chapter title patterns
-        patterns = [
-            r'^Chapter\s+\d+[.:]\s*(.+)$',
-            r'^\d+[.:]\s*(.+)$',
-            r'^[IVX]+[.:]\s*(.+)$',
-        ]
-
         first_line = text.split('\n')[0].strip()
-        for pattern in patterns:
-            match = re.match(pattern, first_line, re.IGNORECASE)
+        for pattern in _CHAPTER_TITLE_RES:
+            match = pattern.match(first_line)
             if match:
                 return match.group(1).strip()
         return None
@@ -204,8 +282,7 @@ class PDFScraper(BaseScraper):
         content = super().normalize_content(content)
         
         # Fix common PDF extraction issues
-        content = re.sub(r'\s+', ' ', content)  # Remove extra whitespace
-        content = re.sub(r'([.!?])\s+([A-Z])', r'\1\n\n\2', content)  # Add paragraph breaks
-        content = re.sub(r'([.!?])\s+([A-Z])', r'\1\n\n\2', content)  # Add paragraph breaks
+        content = _WHITESPACE_RE.sub(' ', content)  # Remove extra whitespace
+        content = _PARAGRAPH_BREAK_RE.sub(r'\1\n\n\2', content)  # Add paragraph breaks
         
         return content.strip() 
\ No newline at end of file